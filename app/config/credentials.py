@@ -9,6 +9,7 @@ class CredentialsManager:
     def __init__(self, config_path='app/config/credentials.json'):
         self.config_path = config_path
         self.credentials = self.load_credentials()
+        self._dirty = False
 
     def load_credentials(self):
         """Loads credentials from the config file."""
@@ -24,8 +25,40 @@ class CredentialsManager:
         """Saves credentials to the config file."""
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        with open(self.config_path, 'w') as f:
+        # Write to a temp file and swap it in so a failed write never truncates the store
+        tmp_path = self.config_path + '.tmp'
+        with open(tmp_path, 'w') as f:
             json.dump(self.credentials, f, indent=4)
+        os.replace(tmp_path, self.config_path)
+        self._dirty = False
+
+    def flush(self):
+        """Saves pending changes, if any. Returns True when the file was written."""
+        if not self._dirty:
+            return False
+        self.save_credentials()
+        return True
+
+    def _update(self, platform, data):
+        """Merges data into a platform's credentials, marking the store dirty on change."""
+        platform_data = self.credentials.setdefault(platform, {})
+        for key, value in data.items():
+            if platform_data.get(key, object()) != value:
+                platform_data[key] = value
+                self._dirty = True
+
+    def get_all(self):
+        """Returns credentials for every platform as {platform: dict}."""
+        return {platform: dict(data) for platform, data in self.credentials.items()}
+
+    def set_all(self, mapping):
+        """
+        Updates several platforms at once ({platform: dict}) and saves with a single write.
+        Nothing is written when the stored values are already up to date.
+        """
+        for platform, data in mapping.items():
+            self._update(platform, data)
+        self.flush()
 
     def get_credential(self, platform, key=None):
         """Gets a specific credential for a platform, or all if key is None."""
@@ -39,15 +72,12 @@ class CredentialsManager:
         Sets a specific credential for a platform.
         If 'key' is a dictionary and 'value' is None, updates the platform with that dictionary.
         """
-        if platform not in self.credentials:
-            self.credentials[platform] = {}
-            
         if isinstance(key, dict) and value is None:
-            self.credentials[platform].update(key)
+            self._update(platform, key)
         else:
-            self.credentials[platform][key] = value
+            self._update(platform, {key: value})
             
-        self.save_credentials()
+        self.flush()
 
 if __name__ == '__main__':
     # Example usage
@@ -14,11 +14,24 @@ import logging
 # For this Python app, we use a hardcoded secret. 
 # YOU (The Admin) must use this SAME secret in your key_gen.py script.
 SECRET_KEY = b"super_secret_video_downloader_key_2025_v1"
+# Fingerprint of the key for debug logs only; verification compares raw digests
+_SECRET_KEY_HASH = hashlib.sha256(SECRET_KEY).hexdigest()
+
+_cached_hwid = None
 
 class LicenseManager:
-    def __init__(self, license_file_path="license.dat"):
+    def __init__(self, license_file_path="license.dat", hwid=None):
+        """
+        hwid skips hardware detection (for tests/debug scripts). Otherwise the
+        detected HWID is shared by every instance, since probing it may spawn wmic.
+        """
+        global _cached_hwid
         self.license_file_path = license_file_path
-        self.hwid = self.get_hwid()
+        if hwid is None:
+            if _cached_hwid is None:
+                _cached_hwid = self.get_hwid()
+            hwid = _cached_hwid
+        self.hwid = hwid
 
     def get_hwid(self):
         """Generates a unique Hardware ID based on system properties."""
@@ -66,12 +79,17 @@ class LicenseManager:
             b64_payload, signature = license_key.split(".")
             
             # DEBUGGING: Log the key used for verification
-            logging.debug(f"Verifying with Key Hash: {hashlib.sha256(SECRET_KEY).hexdigest()}")
+            logging.debug("Verifying with Key Hash: %s", _SECRET_KEY_HASH)
             
             # 1. Verify Signature
-            expected_sig = hmac.new(SECRET_KEY, b64_payload.encode(), hashlib.sha256).hexdigest()
-            if not hmac.compare_digest(expected_sig, signature):
-                logging.error(f"License verification failed: Signature mismatch. Got {signature}, Expected {expected_sig}")
+            # Compare the raw digests in constant time; a non-hex signature can never match
+            expected_sig = hmac.digest(SECRET_KEY, b64_payload.encode(), "sha256")
+            try:
+                provided_sig = bytes.fromhex(signature)
+            except ValueError:
+                provided_sig = b""
+            if not hmac.compare_digest(expected_sig, provided_sig):
+                logging.error(f"License verification failed: Signature mismatch. Got {signature}, Expected {expected_sig.hex()}")
                 return False, "Invalid license signature"
 
             # 2. Decode Payload
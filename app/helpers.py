@@ -1,6 +1,7 @@
 
 import sys
 import os
+import functools
 import urllib.request
 import json
 import logging
@@ -9,6 +10,21 @@ import logging
 Utility functions for the application.
 """
 
+def parse_version(version):
+    """
+    Parses a dotted version like "26.0.1" into (26, 0, 1) so versions compare
+    numerically. Returns None for anything that isn't plain dotted numbers.
+    """
+    try:
+        return tuple(int(part) for part in version.split('.'))
+    except (AttributeError, ValueError):
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _current_version_info():
+    from app.config.version import VERSION
+    return parse_version(VERSION)
+
 def check_for_updates():
     """
     Checks GitHub for a new version.
@@ -25,7 +41,15 @@ def check_for_updates():
             data = json.loads(response.read().decode())
             remote_version = data.get("version")
             
-            if remote_version and remote_version != VERSION:
+            remote_info = parse_version(remote_version)
+            current_info = _current_version_info()
+            if remote_info and current_info:
+                update_available = remote_info > current_info
+            else:
+                # Unparseable on either side: any difference counts as an update
+                update_available = bool(remote_version) and remote_version != VERSION
+
+            if update_available:
                 logging.info(f"Update available: {remote_version} (Current: {VERSION})")
                 return True, data
     except Exception as e:
@@ -33,10 +57,12 @@ def check_for_updates():
     
     return False, None
 
+@functools.lru_cache(maxsize=256)
 def resource_path(relative_path):
     """ 
     Get absolute path to resource.
     Robustly handles Nuitka OneFile by anchoring to the module location.
+    Results are memoized, since each miss probes every root/variant pair on disk.
     """
     roots = []
     
@@ -93,6 +119,7 @@ def resource_path(relative_path):
     # Fallback
     return os.path.join(roots[0] if roots else ".", variants[1] if len(variants) > 1 else rel_norm)
 
+@functools.lru_cache(maxsize=None)
 def get_app_path():
     """
     Returns the absolute path to the application directory.
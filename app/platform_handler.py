@@ -14,6 +14,10 @@ import urllib.request
 import re
 import json
 import shutil
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import psutil
 from app.helpers import get_app_path
 
@@ -32,13 +36,15 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logging.error("Playwright not installed. Please run: pip install playwright && playwright install")
 
+# Built once; is_valid_media_link runs for every scraped anchor
+_MEDIA_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4', '.mkv', '.avi', '.mov', '.webm')
+
 def is_valid_media_link(href, domain):
     """
     Determines if a link is a valid media (image/video) URL based on extension or platform patterns.
     """
     # 1. Check for direct media file extensions
-    media_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.mp4', '.mkv', '.avi', '.mov', '.webm')
-    if href.lower().endswith(media_extensions):
+    if href.lower().endswith(_MEDIA_EXTENSIONS):
         return True
     
     # 2. Platform-specific content patterns
@@ -61,10 +67,8 @@ def is_valid_media_link(href, domain):
         if 'fb.watch' in href:
              return True
              
-        # Exclude common non-video pages to avoid false positives from the scraper
-        if any(x in href for x in ['/photo.php', '/photo/', 'sk=photos', 'sk=about', 'sk=followers', 'sk=following', 'php?id=']):
-            return False
-            
+        # Anything else is rejected, including photo/about/followers pages
+        # (no separate exclusion scan needed, the answer is False either way).
         # A simple path without a specific video indicator is usually a profile link, not a video
         # We allow them to be passed to the handler, but the scraper shouldn't treat them as media
         # Let the handler logic decide if it's a page to be scraped.
@@ -101,59 +105,262 @@ def check_browser_process(browser_name):
 def parse_cookie_file(cookie_file):
     """
     Parses a Netscape format cookie file into a list of dicts for Playwright.
+    Results are cached per (path, mtime, size), so an unchanged file is parsed once.
     """
-    cookies = []
+    try:
+        st = os.stat(cookie_file)
+    except OSError as e:
+        logging.error(f"Error parsing cookie file: {e}")
+        return []
+    return list(_parse_cookie_file_cached(cookie_file, st.st_mtime_ns, st.st_size))
+
+@functools.lru_cache(maxsize=8)
+def _parse_cookie_file_cached(cookie_file, mtime_ns, size):
     try:
         with open(cookie_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                
-                parts = line.strip().split('\t')
-                if len(parts) >= 7:
-                    domain = parts[0]
-                    flag = parts[1] == 'TRUE'
-                    path = parts[2]
-                    secure = parts[3] == 'TRUE'
-                    expiration = int(parts[4]) if parts[4].isdigit() else 0
-                    name = parts[5]
-                    value = parts[6]
-                    
-                    cookie = {
-                        'name': name,
-                        'value': value,
-                        'domain': domain,
-                        'path': path,
-                        'expires': expiration,
-                        'httpOnly': False, # Netscape doesn't specify, assume False
-                        'secure': secure,
-                        'sameSite': 'Lax' # Default safe bet
-                    }
-                    cookies.append(cookie)
+            lines = f.read().splitlines()
     except Exception as e:
         logging.error(f"Error parsing cookie file: {e}")
-    return cookies
+        return ()
 
-def extract_metadata_with_playwright(url, max_entries=100, settings={}, callback=None):
+    cookies = []
+    append = cookies.append
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+
+        parts = line.split('\t')
+        if len(parts) < 7:
+            continue
+        append({
+            'name': parts[5],
+            'value': parts[6],
+            'domain': parts[0],
+            'path': parts[2],
+            'expires': int(parts[4]) if parts[4].isdigit() else 0,
+            'httpOnly': False, # Netscape doesn't specify, assume False
+            'secure': parts[3] == 'TRUE',
+            'sameSite': 'Lax' # Default safe bet
+        })
+    return tuple(cookies)
+
+class _BrowserLaunchError(Exception):
+    pass
+
+# Sync Playwright objects may only be used from the thread that created them,
+# so reusable browsers are cached per thread: {thread id: (playwright, browser)}
+_reusable_browsers = {}
+_reusable_browsers_lock = threading.Lock()
+
+def _launch_chromium(p):
+    try:
+        return p.chromium.launch(headless=True)
+    except Exception as e:
+        raise _BrowserLaunchError(str(e)) from e
+
+def _get_reusable_browser():
+    """Returns the calling thread's warm Chromium, launching it on first use."""
+    key = threading.get_ident()
+    with _reusable_browsers_lock:
+        cached = _reusable_browsers.get(key)
+    if cached and cached[1].is_connected():
+        return cached[1]
+    if cached:
+        # The browser went away; stop its driver before starting another
+        close_reusable_browser()
+
+    p = sync_playwright().start()
+    try:
+        browser = _launch_chromium(p)
+    except _BrowserLaunchError:
+        p.stop()
+        raise
+    with _reusable_browsers_lock:
+        _reusable_browsers[key] = (p, browser)
+    return browser
+
+def close_reusable_browser():
+    """Closes the browser cached for the calling thread, if any."""
+    with _reusable_browsers_lock:
+        cached = _reusable_browsers.pop(threading.get_ident(), None)
+    if not cached:
+        return
+    p, browser = cached
+    try:
+        browser.close()
+    except Exception as e:
+        logging.debug(f"Error closing cached browser: {e}")
+    try:
+        p.stop()
+    except Exception as e:
+        logging.debug(f"Error stopping cached Playwright driver: {e}")
+
+@contextmanager
+def _chromium_browser(reuse=False, browser=None):
+    """
+    Yields a headless Chromium; a reused or caller-supplied browser stays open
+    after the block.
+    """
+    if browser is not None:
+        yield browser
+        return
+    if reuse:
+        yield _get_reusable_browser()
+        return
+    with sync_playwright() as p:
+        browser = _launch_chromium(p)
+        try:
+            yield browser
+        finally:
+            browser.close()
+
+def _block_resource_types(context, resource_types):
+    """Aborts every request in context whose resource type is in resource_types."""
+    blocked = frozenset(resource_types)
+    context.route(
+        "**/*",
+        lambda route: route.abort() if route.request.resource_type in blocked else route.continue_()
+    )
+
+# Link extraction for the scroll loop, installed once per context with
+# add_init_script so each iteration only sends a short call over CDP.
+# window.__sdmScrollAndExtract(settleMs) nudges every scrollable container,
+# waits until newly added links have stopped arriving (at most settleMs),
+# then collects, filters and sorts links.
+_SCROLL_AND_EXTRACT_INIT_JS = """
+window.__sdmScrollAndExtract = async (settleMs) => {
+    // Resolves once new links have been quiet for quietMs, or after maxMs.
+    // Feeds that render quickly no longer pay the full settle time.
+    const waitForNewLinks = (maxMs, quietMs) => new Promise(resolve => {
+        let quietTimer = null;
+        const observer = new MutationObserver(mutations => {
+            const addedLink = mutations.some(m => Array.from(m.addedNodes).some(n =>
+                n.nodeType === 1 && (n.matches('a[href]') || n.querySelector('a[href]'))
+            ));
+            if (addedLink) {
+                clearTimeout(quietTimer);
+                quietTimer = setTimeout(done, quietMs);
+            }
+        });
+        const capTimer = setTimeout(done, maxMs);
+        function done() {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(capTimer);
+            resolve();
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+    });
+    const settled = waitForNewLinks(settleMs, 750);
+
+    try {
+        const containers = document.querySelectorAll('[role="feed"], .scrollable, [style*="overflow: auto"], [style*="overflow: scroll"], [style*="overflow-y: auto"], [style*="overflow-y: scroll"]');
+        containers.forEach(el => {
+            el.scrollTop += 1500;
+        });
+        // Also try window scroll to bottom
+        window.scrollTo(0, document.body.scrollHeight);
+    } catch (e) {}
+
+    const extractLinks = () => {
+        const items = Array.from(document.querySelectorAll('a[href]')).map(a => {
+            let t = a.innerText;
+
+            // Visual coordinates for sorting
+            const rect = a.getBoundingClientRect();
+            const container = a.closest('[data-test-id="pin"], .pin, .post, article, [role="link"]');
+
+            // Filter out generic titles like "Save"
+            const isGeneric = (str) => {
+                if (!str) return true;
+                const s = str.trim().toLowerCase();
+                return s === 'save' || s === 'visit' || s === 'share' || s === 'more' || s.includes('skip');
+            };
+
+            if (isGeneric(t)) {
+                t = a.getAttribute('aria-label') || a.getAttribute('title');
+            }
+
+            // Fallback 2: Image alt text (Common for thumbnail links)
+            if (isGeneric(t)) {
+                const img = a.querySelector('img');
+                if (img) t = img.alt;
+            }
+
+            // Fallback 3: Search the whole container for better text
+            if (isGeneric(t) && container) {
+                // Look for anything that isn't generic
+                const texts = Array.from(container.querySelectorAll('h1, h2, h3, [data-test-id="pin-title"], .title'))
+                    .map(el => el.innerText)
+                    .filter(txt => !isGeneric(txt));
+                if (texts.length > 0) t = texts[0];
+            }
+
+            // Video Hint: Look for video indicators in the item's container
+            let isVideo = false;
+            if (container) {
+                if (container.querySelector('video, [aria-label*="video"], [aria-label*="Video"], .video-icon, [data-test-id*="video"]')) {
+                    isVideo = true;
+                }
+                // Duration patterns like 0:15 or 1:20
+                if (container.innerText && container.innerText.match(/\\d+:\\d+/)) {
+                    isVideo = true;
+                }
+            }
+
+            return {
+                url: a.href,
+                text: t,
+                top: rect.top + window.scrollY,
+                left: rect.left + window.scrollX,
+                is_video_hint: isVideo
+            };
+        });
+
+        // Filter and Deduplicate
+        const unique = new Map();
+        items.forEach(item => {
+            if (!item.url || !item.url.startsWith('http')) return;
+            const lowText = item.text ? item.text.toLowerCase() : "";
+            if (lowText.includes('skip to content') || 
+                lowText.includes('skip to main') ||
+                lowText === 'skip') return;
+
+            // DO NOT aggressively normalize URL here, let python handle it.
+            if (!unique.has(item.url)) {
+                unique.set(item.url, item);
+            }
+        });
+
+        return Array.from(unique.values()).sort((a, b) => {
+            // Sort by top (vertical), then by left (horizontal)
+            const rowDiff = a.top - b.top;
+            if (Math.abs(rowDiff) > 150) return rowDiff;
+            return a.left - b.left;
+        });
+    };
+
+    await settled;
+    return extractLinks();
+};
+"""
+
+def extract_metadata_with_playwright(url, max_entries=100, settings={}, callback=None, reuse_browser=False, browser=None):
     """
     Helper to extract metadata using Playwright.
+    With reuse_browser, the calling thread keeps a warm Chromium between calls
+    (see close_reusable_browser); each call still gets a fresh context, so no
+    login state carries over from an earlier call.
+    A browser passed in (from the calling thread) is used as-is and left open;
+    only the context created here is closed.
     """
     if not PLAYWRIGHT_AVAILABLE:
         return [{'url': url, 'title': 'Error: Playwright Missing', 'type': 'error'}]
 
     results = []
     try:
-        with sync_playwright() as p:
-            # Try launching Chromium
-            try:
-                browser = p.chromium.launch(headless=True)
-            except Exception as e:
-                logging.error(f"Error launching browser: {e}")
-                # Try to give a hint about the error
-                if "Executable doesn't exist" in str(e):
-                    logging.error("Playwright cannot find the browser. Please ensure the 'playwright-browsers' folder is in the app directory.")
-                return [{'url': url, 'title': 'Error: Browser Launch Failed', 'type': 'error'}]
-
+        with _chromium_browser(reuse_browser, browser) as browser:
             context = browser.new_context(
                 user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             )
@@ -170,6 +377,7 @@ def extract_metadata_with_playwright(url, max_entries=100, settings={}, callback
                     except Exception as e:
                         logging.error(f"Failed to add cookies to context: {e}")
             
+            context.add_init_script(_SCROLL_AND_EXTRACT_INIT_JS)
             page = context.new_page()
             
             logging.info(f"Playwright visiting: {url}")
@@ -194,87 +402,6 @@ def extract_metadata_with_playwright(url, max_entries=100, settings={}, callback
                 unique_urls = set()
                 all_seen_links = set() # Track all seen links to detect true stagnation
                 results = []
-
-                # Extraction function to run in browser (reusable)
-                extract_func = """
-                    () => {
-                        const items = Array.from(document.querySelectorAll('a[href]')).map(a => {
-                            let t = a.innerText;
-                            
-                            // Visual coordinates for sorting
-                            const rect = a.getBoundingClientRect();
-                            const container = a.closest('[data-test-id="pin"], .pin, .post, article, [role="link"]');
-
-                            // Filter out generic titles like "Save"
-                            const isGeneric = (str) => {
-                                if (!str) return true;
-                                const s = str.trim().toLowerCase();
-                                return s === 'save' || s === 'visit' || s === 'share' || s === 'more' || s.includes('skip');
-                            };
-
-                            if (isGeneric(t)) {
-                                t = a.getAttribute('aria-label') || a.getAttribute('title');
-                            }
-
-                            // Fallback 2: Image alt text (Common for thumbnail links)
-                            if (isGeneric(t)) {
-                                const img = a.querySelector('img');
-                                if (img) t = img.alt;
-                            }
-
-                            // Fallback 3: Search the whole container for better text
-                            if (isGeneric(t) && container) {
-                                // Look for anything that isn't generic
-                                const texts = Array.from(container.querySelectorAll('h1, h2, h3, [data-test-id="pin-title"], .title'))
-                                    .map(el => el.innerText)
-                                    .filter(txt => !isGeneric(txt));
-                                if (texts.length > 0) t = texts[0];
-                            }
-                            
-                            // Video Hint: Look for video indicators in the item's container
-                            let isVideo = false;
-                            if (container) {
-                                if (container.querySelector('video, [aria-label*="video"], [aria-label*="Video"], .video-icon, [data-test-id*="video"]')) {
-                                    isVideo = true;
-                                }
-                                // Duration patterns like 0:15 or 1:20
-                                if (container.innerText && container.innerText.match(/\\d+:\\d+/)) {
-                                    isVideo = true;
-                                }
-                            }
-
-                            return {
-                                url: a.href,
-                                text: t,
-                                top: rect.top + window.scrollY,
-                                left: rect.left + window.scrollX,
-                                is_video_hint: isVideo
-                            };
-                        });
-                        
-                        // Filter and Deduplicate
-                        const unique = new Map();
-                        items.forEach(item => {
-                            if (!item.url || !item.url.startsWith('http')) return;
-                            const lowText = item.text ? item.text.toLowerCase() : "";
-                            if (lowText.includes('skip to content') || 
-                                lowText.includes('skip to main') ||
-                                lowText === 'skip') return;
-                            
-                            // DO NOT aggressively normalize URL here, let python handle it.
-                            if (!unique.has(item.url)) {
-                                unique.set(item.url, item);
-                            }
-                        });
-
-                        return Array.from(unique.values()).sort((a, b) => {
-                            // Sort by top (vertical), then by left (horizontal)
-                            const rowDiff = a.top - b.top;
-                            if (Math.abs(rowDiff) > 150) return rowDiff;
-                            return a.left - b.left;
-                        });
-                    }
-                """
                 
                 # Dynamic Loop
                 # Use a while loop to ensure we keep scrolling until we get enough items
@@ -304,41 +431,23 @@ def extract_metadata_with_playwright(url, max_entries=100, settings={}, callback
                     page.keyboard.press("End")
                     time.sleep(0.5)
                     
-                    # 4. Scroll ALL potential containers (Facebook/Insta specific)
-                    try:
-                        page.evaluate("""
-                            () => {
-                                const containers = document.querySelectorAll('[role="feed"], .scrollable, [style*="overflow: auto"], [style*="overflow: scroll"], [style*="overflow-y: auto"], [style*="overflow-y: scroll"]');
-                                containers.forEach(el => {
-                                    el.scrollTop += 1500;
-                                });
-                                // Also try window scroll to bottom
-                                window.scrollTo(0, document.body.scrollHeight);
-                            }
-                        """)
-                    except Exception:
-                        pass
-
-                    # Wait for load (increased to 4s for reliability)
-                    time.sleep(4.0)
+                    # 4. Scroll ALL potential containers (Facebook/Insta specific),
+                    # wait for new links to settle (at most 4s) and extract incrementally
+                    extracted_links = page.evaluate("ms => window.__sdmScrollAndExtract(ms)", 4000)
                     
                     logging.debug(f"Scroll iteration {iteration} completed")
                     
-                    # Incremental extraction
-                    extracted_links = page.evaluate(extract_func)
-                    
                     new_items_found = 0
-                    raw_new_items = 0
+                    
+                    # Track raw progress to prevent premature stagnation
+                    raw_new_links = {link['url'] for link in extracted_links} - all_seen_links
+                    raw_new_items = len(raw_new_links)
+                    all_seen_links |= raw_new_links
                     
                     for link in extracted_links:
                         href = link['url']
                         text = link['text'] or "Scraped Link"
                         
-                        # Track raw progress to prevent premature stagnation
-                        if href not in all_seen_links:
-                            all_seen_links.add(href)
-                            raw_new_items += 1
-                        
                         # For Facebook/Insta, DO NOT strip query params aggressively if they contain video IDs
                         if 'facebook.com' in domain:
                              clean_href = href
@@ -423,8 +532,14 @@ def extract_metadata_with_playwright(url, max_entries=100, settings={}, callback
                 logging.error(f"Error processing page {url}: {e}")
                 results.append({'url': url, 'title': 'Page Load Error', 'type': 'error'})
             finally:
-                browser.close()
+                context.close()
                 
+    except _BrowserLaunchError as e:
+        logging.error(f"Error launching browser: {e}")
+        # Try to give a hint about the error
+        if "Executable doesn't exist" in str(e):
+            logging.error("Playwright cannot find the browser. Please ensure the 'playwright-browsers' folder is in the app directory.")
+        return [{'url': url, 'title': 'Error: Browser Launch Failed', 'type': 'error'}]
     except Exception as e:
         logging.error(f"Playwright script error: {e}")
         results.append({'url': url, 'title': 'Scrape System Error', 'type': 'error'})
@@ -846,6 +961,27 @@ def download_with_ytdlp(url, output_path, progress_callback, settings={}):
             raise e 
         return False, "Failed"
 
+def _stream_to_file(url, full_path, progress_callback, chunk_size=1 << 20):
+    """
+    Streams url into full_path in large chunks, reporting progress only when
+    the whole percentage changes (urlretrieve calls back every 8 KiB block).
+    """
+    with urllib.request.urlopen(url, timeout=30) as response, open(full_path, 'wb') as f:
+        total = int(response.headers.get('Content-Length') or 0)
+        downloaded = 0
+        last_percent = -1
+        while True:
+            chunk = response.read(chunk_size)
+            if not chunk:
+                break
+            f.write(chunk)
+            downloaded += len(chunk)
+            if total > 0:
+                percent = min(downloaded * 100 // total, 100)
+                if percent != last_percent:
+                    progress_callback(percent)
+                    last_percent = percent
+
 def download_direct(url, output_path, title, progress_callback, settings={}):
     """
     Helper to download a file directly using urllib.
@@ -870,12 +1006,7 @@ def download_direct(url, output_path, title, progress_callback, settings={}):
         if not os.path.exists(output_path):
             os.makedirs(output_path)
 
-        def report_hook(block_num, block_size, total_size):
-            if total_size > 0:
-                percent = int((block_num * block_size * 100) / total_size)
-                progress_callback(min(percent, 100))
-
-        urllib.request.urlretrieve(url, full_path, report_hook)
+        _stream_to_file(url, full_path, progress_callback)
         
         # Handle Caption (.txt) generation
         naming_style = settings.get('naming_style', 'Original Name')
@@ -898,6 +1029,107 @@ def download_direct(url, output_path, title, progress_callback, settings={}):
 
 import json
 
+# Pinterest ships its page state in the server-rendered HTML
+_PWS_DATA_RE = re.compile(rb'<script[^>]*\bid="__PWS_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+def _fetch_pws_data(url):
+    """
+    Fetches a Pinterest page over plain HTTP and returns its __PWS_DATA__
+    JSON (bytes), or None. No browser is started, so this is tried first.
+    """
+    try:
+        req = urllib.request.Request(
+            url,
+            headers={'User-Agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"}
+        )
+        with urllib.request.urlopen(req, timeout=15) as response:
+            match = _PWS_DATA_RE.search(response.read())
+        return match.group(1) if match else None
+    except Exception as e:
+        logging.debug(f"Plain HTTP fetch of {url} failed: {e}")
+        return None
+
+def _read_pws_data(page, response):
+    """
+    Returns the __PWS_DATA__ JSON text for a Pinterest page, or None.
+    Reads it straight from the document response when possible, which skips
+    a DOM round-trip; falls back to the live DOM if the HTML lacks it.
+    """
+    if response is not None:
+        try:
+            match = _PWS_DATA_RE.search(response.body())
+            if match:
+                return match.group(1)
+        except Exception as e:
+            logging.debug(f"Could not read __PWS_DATA__ from response body: {e}")
+    return page.evaluate("""
+        () => {
+            const script = document.getElementById('__PWS_DATA__');
+            return script ? script.innerText : null;
+        }
+    """)
+
+def _raw_contains(raw, key):
+    """Substring test on JSON text that may be str (DOM) or bytes (response body)."""
+    return (key.encode() if isinstance(raw, bytes) else key) in raw
+
+def _walk_json(data):
+    """
+    Yields every dict in a parsed JSON document, depth-first in document order.
+    Iterative, so deeply nested page state can't hit the recursion limit.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        t = type(obj)
+        if t is dict:
+            yield obj
+            stack.extend(reversed(list(obj.values())))
+        elif t is list:
+            stack.extend(reversed(obj))
+
+def _pick_video_url(v_list):
+    # Prefer higher quality
+    if 'V_720P' in v_list: return v_list['V_720P']['url']
+    if 'V_EXP7' in v_list: return v_list['V_EXP7']['url']
+    if 'V_HLSV3_MOBILE' in v_list: return v_list['V_HLSV3_MOBILE']['url']
+    # Return first available
+    for k, v in v_list.items():
+        if 'url' in v: return v['url']
+    return None
+
+def _pick_image_url(imgs):
+    if 'orig' in imgs and 'url' in imgs['orig']:
+        return imgs['orig']['url']
+    if 'large' in imgs and 'url' in imgs['large']:
+        return imgs['large']['url']
+    return None
+
+def _video_url_from_pws(json_data):
+    # Skip parsing and walking the (large) blob when it has no video list
+    if json_data and _raw_contains(json_data, '"video_list"'):
+        return _find_pinterest_video_url(json.loads(json_data))
+    return None
+
+def _image_url_from_pws(json_data):
+    if json_data and _raw_contains(json_data, '"images"'):
+        return _find_pinterest_image_url(json.loads(json_data))
+    return None
+
+def _find_pinterest_video_url(data):
+    for obj in _walk_json(data):
+        if 'video_list' in obj:
+            res = _pick_video_url(obj['video_list'])
+            if res: return res
+    return None
+
+def _find_pinterest_image_url(data):
+    for obj in _walk_json(data):
+        if 'images' in obj and isinstance(obj['images'], dict):
+            res = _pick_image_url(obj['images'])
+            if res: return res
+    return None
+
 def extract_pinterest_direct_url(url):
     """
     Uses Playwright to extract the direct video URL from Pinterest.
@@ -906,18 +1138,45 @@ def extract_pinterest_direct_url(url):
     2. Parse the __PWS_DATA__ JSON blob (most reliable).
     3. Inspect DOM for <video> tags.
     4. Regex scan page content.
+    The page state usually ships in the server-rendered HTML, so a plain HTTP
+    fetch of it is tried before any browser is started.
     """
+    try:
+        extracted_url = _video_url_from_pws(_fetch_pws_data(url))
+        if extracted_url:
+            logging.info(f"Found video URL in page HTML: {extracted_url}")
+            return extracted_url
+    except Exception as e:
+        logging.warning(f"JSON parsing of page HTML failed: {e}")
+
+    return _pinterest_video_url_with_playwright(url)
+
+def _pinterest_video_url_with_playwright(url):
+    """Browser half of extract_pinterest_direct_url (strategies 1-4)."""
     if not PLAYWRIGHT_AVAILABLE:
         return None
         
     video_url = None
     
+    def is_video_response(response):
+        return 'pinimg.com' in response.url and ('.m3u8' in response.url or '.mp4' in response.url)
+
     def handle_response(response):
         nonlocal video_url
         if video_url: return
-        if response.request.resource_type == "media" or '.m3u8' in response.url or '.mp4' in response.url:
-             if 'pinimg.com' in response.url and ('.m3u8' in response.url or '.mp4' in response.url):
-                 video_url = response.url
+        if is_video_response(response):
+            video_url = response.url
+
+    def wait_for_video_response(timeout_ms):
+        # Returns as soon as the first video response lands instead of sleeping
+        # the full timeout; page events are only delivered while Playwright waits.
+        nonlocal video_url
+        if video_url: return
+        try:
+            response = page.wait_for_event("response", predicate=is_video_response, timeout=timeout_ms)
+            video_url = video_url or response.url
+        except Exception:
+            pass
 
     try:
         with sync_playwright() as p:
@@ -934,19 +1193,20 @@ def extract_pinterest_direct_url(url):
             # Use a mobile user agent to potentially get a simpler page structure
             # but desktop often has the full JSON data. Let's stick to a modern desktop UA.
             context = browser.new_context(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            # Only the HTML, scripts and the video itself matter here
+            _block_resource_types(context, ("image", "font", "stylesheet"))
             page = context.new_page()
             page.on("response", handle_response)
             
             logging.info(f"Playwright fallback scraping for: {url}")
+            response = None
             try:
-                page.goto(url, timeout=30000, wait_until="domcontentloaded")
+                response = page.goto(url, timeout=30000, wait_until="domcontentloaded")
             except Exception:
                 pass 
 
             # Strategy 1: Check if network intercept caught it immediately
-            start_time = time.time()
-            while not video_url and time.time() - start_time < 3:
-                page.wait_for_timeout(500)
+            wait_for_video_response(3000)
             
             if video_url:
                 browser.close()
@@ -954,53 +1214,20 @@ def extract_pinterest_direct_url(url):
 
             # Strategy 2: Parse __PWS_DATA__ JSON
             try:
-                # Get the script content
-                json_data = page.evaluate("""
-                    () => {
-                        const script = document.getElementById('__PWS_DATA__');
-                        return script ? script.innerText : null;
-                    }
-                """)
-                
-                if json_data:
-                    data = json.loads(json_data)
-                    # Traverse JSON to find video URL
-                    # Structure varies, need to search recursively or check known paths
-                    
-                    def find_video_url(obj):
-                        if isinstance(obj, dict):
-                            if 'video_list' in obj:
-                                v_list = obj['video_list']
-                                # Prefer higher quality
-                                if 'V_720P' in v_list: return v_list['V_720P']['url']
-                                if 'V_EXP7' in v_list: return v_list['V_EXP7']['url']
-                                if 'V_HLSV3_MOBILE' in v_list: return v_list['V_HLSV3_MOBILE']['url']
-                                # Return first available
-                                for k, v in v_list.items():
-                                    if 'url' in v: return v['url']
-                            
-                            for key, value in obj.items():
-                                res = find_video_url(value)
-                                if res: return res
-                        elif isinstance(obj, list):
-                            for item in obj:
-                                res = find_video_url(item)
-                                if res: return res
-                        return None
-
-                    extracted_url = find_video_url(data)
-                    if extracted_url:
-                        # Sometimes it's an .m3u8, sometimes .mp4
-                        logging.info(f"Found video URL in JSON: {extracted_url}")
-                        browser.close()
-                        return extracted_url
+                # Get the script content and traverse it for a video URL
+                extracted_url = _video_url_from_pws(_read_pws_data(page, response))
+                if extracted_url:
+                    # Sometimes it's an .m3u8, sometimes .mp4
+                    logging.info(f"Found video URL in JSON: {extracted_url}")
+                    browser.close()
+                    return extracted_url
             except Exception as e:
                 logging.warning(f"JSON parsing failed: {e}")
 
             # Strategy 3: Check DOM for video tag
             try:
                 page.evaluate("() => { const v = document.querySelector('video'); if(v) v.play(); }")
-                time.sleep(2)
+                wait_for_video_response(2000)
                 
                 if video_url:
                     browser.close()
@@ -1035,8 +1262,24 @@ def extract_pinterest_direct_url(url):
 def extract_pinterest_image_url(url):
     """
     Uses Playwright to extract the high-res image URL from Pinterest.
+    Like extract_pinterest_direct_url, tries the plain HTML page state first.
     """
-    if not PLAYWRIGHT_AVAILABLE:
+    try:
+        extracted_url = _image_url_from_pws(_fetch_pws_data(url))
+        if extracted_url:
+            logging.info(f"Found image URL in page HTML: {extracted_url}")
+            return extracted_url
+    except Exception as e:
+        logging.warning(f"JSON parsing of page HTML for image failed: {e}")
+
+    return _pinterest_image_url_with_playwright(url)
+
+def _pinterest_image_url_with_playwright(url, cancelled=None):
+    """
+    Browser half of extract_pinterest_image_url. Gives up early, returning
+    None, once the optional cancelled Event is set.
+    """
+    if not PLAYWRIGHT_AVAILABLE or (cancelled and cancelled.is_set()):
         return None
     
     image_url = None
@@ -1054,48 +1297,27 @@ def extract_pinterest_image_url(url):
             # Use a mobile user agent to potentially get a simpler page structure
             # but desktop often has the full JSON data. Let's stick to a modern desktop UA.
             context = browser.new_context(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+            # Images and stylesheets stay: the DOM fallback ranks <img> by rendered size
+            _block_resource_types(context, ("font", "media"))
             page = context.new_page()
             
             logging.info(f"Playwright image scraping for: {url}")
+            response = None
             try:
-                page.goto(url, timeout=30000, wait_until="domcontentloaded")
+                response = page.goto(url, timeout=30000, wait_until="domcontentloaded")
             except Exception:
                 pass 
 
+            if cancelled and cancelled.is_set():
+                browser.close()
+                return None
+
             # Strategy 1: Parse __PWS_DATA__ JSON
             try:
-                json_data = page.evaluate("""
-                    () => {
-                        const script = document.getElementById('__PWS_DATA__');
-                        return script ? script.innerText : null;
-                    }
-                """)
-                
-                if json_data:
-                    data = json.loads(json_data)
-                    
-                    def find_image_url(obj):
-                        if isinstance(obj, dict):
-                            if 'images' in obj and isinstance(obj['images'], dict):
-                                imgs = obj['images']
-                                if 'orig' in imgs and 'url' in imgs['orig']:
-                                    return imgs['orig']['url']
-                                if 'large' in imgs and 'url' in imgs['large']:
-                                    return imgs['large']['url']
-                            
-                            for key, value in obj.items():
-                                res = find_image_url(value)
-                                if res: return res
-                        elif isinstance(obj, list):
-                            for item in obj:
-                                res = find_image_url(item)
-                                if res: return res
-                        return None
-
-                    extracted_url = find_image_url(data)
-                    if extracted_url:
-                        logging.info(f"Found image URL in JSON: {extracted_url}")
-                        image_url = extracted_url
+                extracted_url = _image_url_from_pws(_read_pws_data(page, response))
+                if extracted_url:
+                    logging.info(f"Found image URL in JSON: {extracted_url}")
+                    image_url = extracted_url
             except Exception as e:
                 logging.warning(f"JSON parsing for image failed: {e}")
 
@@ -1317,13 +1539,43 @@ class PinterestHandler(BaseHandler):
             # Note: yt-dlp might fail for simple images, so we consider failure as "try next method"
             # Suppress "No video formats found" errors for Pinterest as they are common for images
             settings['suppress_expected_errors'] = True 
-            if download_with_ytdlp(url, output_path, progress_callback, settings):
-                return True
+            result = download_with_ytdlp(url, output_path, progress_callback, settings)
+            if result[0]:
+                return result
             
-            # 2. Fallback: Extract direct video URL
+            # 2./3. Fallbacks: one plain HTTP fetch of the page state. A video
+            # URL there ends the search; otherwise the browser video lookup
+            # still runs (its network/DOM strategies find videos the page state
+            # lacks), side by side with a browser image lookup when the page
+            # state had no image either. An image is only used without a video.
             logging.info(f"Standard download failed for {url}. Attempting fallback extraction...")
-            direct_url = extract_pinterest_direct_url(url)
-            
+            pws_data = _fetch_pws_data(url)
+            direct_url = page_image_url = image_url = None
+            try:
+                direct_url = _video_url_from_pws(pws_data)
+                if not direct_url:
+                    page_image_url = _image_url_from_pws(pws_data)
+            except Exception as e:
+                logging.warning(f"JSON parsing of page HTML failed: {e}")
+
+            if not direct_url:
+                video_found = threading.Event()
+                lookups = ThreadPoolExecutor(max_workers=2)
+                video_lookup = lookups.submit(_pinterest_video_url_with_playwright, url)
+                image_lookup = None
+                if not page_image_url:
+                    image_lookup = lookups.submit(_pinterest_image_url_with_playwright, url, video_found)
+                lookups.shutdown(wait=False)
+
+                direct_url = video_lookup.result()
+                if direct_url:
+                    # The image is no longer needed; stop that browser early
+                    video_found.set()
+                    if image_lookup:
+                        image_lookup.cancel()
+                else:
+                    image_url = page_image_url or (image_lookup.result() if image_lookup else None)
+
             if direct_url:
                 logging.info(f"Found direct video URL: {direct_url}")
                 # Use yt-dlp on the direct URL (it handles headers/streams better than urllib)
@@ -1331,8 +1583,6 @@ class PinterestHandler(BaseHandler):
             
             # 3. Fallback: Extract direct Image URL (New Logic)
             logging.info(f"Video extraction failed for {url}. Checking for image...")
-            image_url = extract_pinterest_image_url(url)
-            
             if image_url:
                 logging.info(f"Found direct image URL: {image_url}")
                 # Update output path for image (since we defaulted to video path above)
@@ -1342,24 +1592,24 @@ class PinterestHandler(BaseHandler):
                 logging.error("Fallback extraction failed.")
                 return False
 
+# Use regex to be more specific about valid Facebook video/reel URLs
+# This handles:
+# - /videos/some_id
+# - /reel/some_id
+# - /watch/?v=some_id
+# - fb.watch/shortlink
+# - /story.php?story_fbid=...
+_FACEBOOK_VIDEO_URL_RE = re.compile(
+    r'facebook\.com/(?:video\.php\?v=|watch/?\?v=|reel/|story\.php\?story_fbid=|[^/]+/videos/|[^/]+/reels/)|fb\.watch/'
+)
+
 class FacebookHandler(BaseHandler):
     def can_handle(self, url):
-        # Use regex to be more specific about valid Facebook video/reel URLs
-        # This handles:
-        # - /videos/some_id
-        # - /reel/some_id
-        # - /watch/?v=some_id
-        # - fb.watch/shortlink
-        # - /story.php?story_fbid=...
-        # - profile/page URLs with sk=videos or sk=reels_tab for scraping
-        pattern = re.compile(
-            r'facebook\.com/(?:video\.php\?v=|watch/?\?v=|reel/|story\.php\?story_fbid=|[^/]+/videos/|[^/]+/reels/)|fb\.watch/'
-        )
         # Also allow profile pages that are specifically for videos/reels to be handled for scraping
         if 'sk=videos' in url or 'sk=reels_tab' in url:
             return True
             
-        return pattern.search(url) is not None
+        return _FACEBOOK_VIDEO_URL_RE.search(url) is not None
 
     def get_metadata(self, url):
         # Prefer Playwright for Facebook metadata as yt-dlp often fails on profiles/reels
@@ -1410,9 +1660,15 @@ class PlatformHandlerFactory:
             FacebookHandler(),
             InstagramHandler(),
         ]
+        # Scraping resolves a handler for every link it finds, often the same
+        # URL more than once; remember each answer instead of probing again
+        self._lookup = functools.lru_cache(maxsize=4096)(self._find_handler)
 
-    def get_handler(self, url):
+    def _find_handler(self, url):
         for handler in self.handlers:
             if handler.can_handle(url):
                 return handler
-        return None
\ No newline at end of file
+        return None
+
+    def get_handler(self, url):
+        return self._lookup(url)
\ No newline at end of file
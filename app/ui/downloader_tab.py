@@ -179,6 +179,7 @@ class DownloaderTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        self._settings_tab_factory = None # Builds the settings tab on first use
         self.settings_tab = None # Reference to settings tab
 
         # --- Backend Setup ---
@@ -859,8 +860,8 @@ class DownloaderTab(QWidget):
 
         # Update System State
         self.pending_update_info = None
-        # Trigger silent update check on startup
-        QTimer.singleShot(2000, self.run_silent_update_check) # Delay slightly to let UI load
+        # The silent update check is started by main() as soon as the window
+        # exists, so it runs alongside the rest of startup
 
     def run_silent_update_check(self):
         """Runs update check in background without UI feedback unless update found."""
@@ -1113,6 +1114,20 @@ class DownloaderTab(QWidget):
         """Sets the reference to the settings tab."""
         self.settings_tab = settings_tab
 
+    def set_settings_tab_factory(self, factory):
+        """Sets a callable that builds the settings tab the first time it is needed."""
+        self._settings_tab_factory = factory
+
+    @property
+    def settings_tab(self):
+        if self._settings_tab is None and self._settings_tab_factory is not None:
+            self._settings_tab = self._settings_tab_factory()
+        return self._settings_tab
+
+    @settings_tab.setter
+    def settings_tab(self, settings_tab):
+        self._settings_tab = settings_tab
+
     def open_license_dialog(self):
         dialog = LicenseDialog(self)
         if dialog.exec():
@@ -13,19 +13,7 @@ class EditUsernameDialog(CustomDialogBase):
         # Input Field
         self.username_input = QLineEdit(current_username)
         self.username_input.setPlaceholderText("Enter new username...")
-        self.username_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #27272A;
-                border: 1px solid #3F3F46;
-                padding: 4px 8px;
-                border-radius: 4px;
-                color: #F4F4F5;
-                font-size: 10pt;
-            }
-            QLineEdit:focus {
-                border-color: #3B82F6;
-            }
-        """)
+        self.username_input.setObjectName("DialogInput")
         self.content_layout.addWidget(self.username_input)
 
         # Buttons
@@ -35,36 +23,13 @@ class EditUsernameDialog(CustomDialogBase):
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setCursor(Qt.PointingHandCursor)
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #A1A1AA;
-                border: 1px solid #3F3F46;
-                border-radius: 4px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #27272A;
-                color: white;
-            }
-        """)
+        cancel_btn.setObjectName("DialogSecondaryButton")
         btn_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Save")
         save_btn.setCursor(Qt.PointingHandCursor)
         save_btn.clicked.connect(self.save_username)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B82F6;
-                color: white;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #2563EB;
-            }
-        """)
+        save_btn.setObjectName("DialogPrimaryButton")
         btn_layout.addWidget(save_btn)
 
         self.content_layout.addLayout(btn_layout)
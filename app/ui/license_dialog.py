@@ -17,41 +17,25 @@ class LicenseDialog(CustomDialogBase):
         # Add content to self.content_layout provided by base class
 
         # Status Header
+        # Styled by the dialog rules in styles.qss; the "valid" property switches red/green
         self.status_label = QLabel("License Required")
-        self.status_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #EF4444;") # Red
+        self.status_label.setObjectName("LicenseStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
         self.content_layout.addWidget(self.status_label)
 
         # HWID Section
         hwid_label = QLabel("Your Hardware ID (Send this to Admin):")
-        hwid_label.setStyleSheet("color: #A1A1AA; font-size: 9pt;")
+        hwid_label.setObjectName("DialogHint")
         self.content_layout.addWidget(hwid_label)
 
         hwid_box = QHBoxLayout()
         self.hwid_display = QLineEdit(self.license_manager.hwid)
         self.hwid_display.setReadOnly(True)
-        self.hwid_display.setStyleSheet("""
-            QLineEdit {
-                background-color: #27272A; 
-                border: 1px solid #3F3F46; 
-                padding: 4px 8px; 
-                border-radius: 4px;
-                color: #F4F4F5;
-            }
-        """)
+        self.hwid_display.setObjectName("DialogInput")
         
         copy_btn = QPushButton("Copy")
         copy_btn.setCursor(Qt.PointingHandCursor)
-        copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3B82F6; 
-                color: white; 
-                border-radius: 4px; 
-                padding: 6px 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover { background-color: #2563EB; }
-        """)
+        copy_btn.setObjectName("DialogPrimaryButton")
         copy_btn.clicked.connect(self.copy_hwid)
         
         hwid_box.addWidget(self.hwid_display)
@@ -60,37 +44,19 @@ class LicenseDialog(CustomDialogBase):
 
         # Input Section
         key_label = QLabel("Enter License Key:")
-        key_label.setStyleSheet("color: #A1A1AA; font-size: 9pt; margin-top: 5px;")
+        key_label.setObjectName("LicenseKeyLabel")
         self.content_layout.addWidget(key_label)
 
         self.key_input = QLineEdit()
         self.key_input.setPlaceholderText("Paste your key here...")
-        self.key_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #27272A; 
-                border: 1px solid #3F3F46; 
-                padding: 4px 8px; 
-                border-radius: 4px;
-                color: #F4F4F5;
-            }
-            QLineEdit:focus { border-color: #3B82F6; }
-        """)
+        self.key_input.setObjectName("DialogInput")
         self.content_layout.addWidget(self.key_input)
 
         # Activate Button
         self.activate_btn = QPushButton("Activate License")
         self.activate_btn.setCursor(Qt.PointingHandCursor)
         self.activate_btn.setFixedHeight(35)
-        self.activate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #10B981; 
-                color: white; 
-                font-weight: bold; 
-                border-radius: 6px;
-                font-size: 10pt;
-            }
-            QPushButton:hover { background-color: #059669; }
-        """)
+        self.activate_btn.setObjectName("LicenseActivateButton")
         self.activate_btn.clicked.connect(self.activate)
         self.content_layout.addWidget(self.activate_btn)
         
@@ -102,34 +68,15 @@ class LicenseDialog(CustomDialogBase):
         is_valid, msg, _ = self.license_manager.get_license_status()
         if is_valid:
             self.status_label.setText(f"Active: {msg}")
-            self.status_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #10B981;") # Green
             self.activate_btn.setText("Update License")
             self.key_input.setText("License is valid.")
-            # Make close button red to indicate "Active/Done" state visually if desired
-            self.close_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #EF4444;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #DC2626;
-                }
-            """)
         else:
             self.status_label.setText("License Required")
-            self.status_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #EF4444;") # Red
-            # Reset close button style for inactive state
-            self.close_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #EF4444;
-                }
-            """)
+        # Green status and a red close button (the "Active/Done" look) when valid
+        for widget in (self.status_label, self.close_btn):
+            widget.setProperty("valid", is_valid)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def copy_hwid(self):
         clipboard = QApplication.clipboard()
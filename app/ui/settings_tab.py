@@ -5,133 +5,84 @@ The UI for the Settings tab.
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QTabWidget, QHBoxLayout, 
     QCheckBox, QSpinBox, QComboBox, QLabel, QFormLayout, QPushButton, QMessageBox,
-    QLineEdit, QFileDialog
+    QLineEdit, QFileDialog, QApplication
 )
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Qt, Signal, Slot, QThread, QSize
-import yt_dlp
+from PySide6.QtCore import Qt, Signal, Slot, QThread, QSize, QObject, QStringListModel, QRunnable, QThreadPool, QTimer
 import os
 import sys
-import tempfile
-import json # for yt-dlp output parsing
+import threading
+import multiprocessing
+from collections import deque
 import logging
 
 from app.config.settings_manager import load_settings, save_settings
 from app.config.credentials import CredentialsManager
 from app.config.version import VERSION
-from app.platform_handler import extract_metadata_with_playwright
 from app.helpers import resource_path, check_for_updates
 
-# --- Styles ---
-VERIFY_BTN_STYLE = """
-    QPushButton {
-        background-color: #3B82F6;
-        color: white;
-        border: none;
-        padding: 6px 12px;
-        border-radius: 6px;
-        font-weight: bold;
-        font-size: 10pt;
-        margin-top: 8px;
-    }
-    QPushButton:hover {
-        background-color: #2563EB;
-    }
-    QPushButton:pressed {
-        background-color: #1D4ED8;
-    }
-"""
-
-UPDATE_BTN_STYLE = """
-    QPushButton {
-        background-color: #10B981;
-        color: white;
-        border: none;
-        padding: 8px 16px;
-        border-radius: 6px;
-        font-weight: bold;
-        font-size: 10pt;
-    }
-    QPushButton:hover {
-        background-color: #059669;
-    }
-    QPushButton:pressed {
-        background-color: #047857;
-    }
-    QPushButton:disabled {
-        background-color: #3F3F46;
-        color: #71717A;
-    }
-"""
-
-SAVE_BTN_STYLE = """
-    QPushButton {
-        background-color: #3B82F6;
-        color: white;
-        border: none;
-        padding: 10px 20px;
-        border-radius: 6px;
-        font-weight: bold;
-        font-size: 11pt;
-    }
-    QPushButton:hover {
-        background-color: #2563EB;
-    }
-    QPushButton:pressed {
-        background-color: #1D4ED8;
-    }
-"""
-
-INPUT_STYLE = """
-    QComboBox, QSpinBox {
-        background-color: #1C1C21;
-        border: 2px solid #27272A;
-        border-radius: 8px;
-        padding: 4px 8px;
-        color: #F4F4F5;
-        font-size: 10pt;
-        min-width: 80px;
-    }
-    QComboBox:hover, QSpinBox:hover {
-        border-color: #3B82F6;
-        background-color: #202025;
-    }
-    QComboBox::drop-down {
-        border: none;
-        width: 20px;
-    }
-    QCheckBox {
-        color: #F4F4F5;
-        font-size: 10pt;
-        background-color: transparent;
-        spacing: 8px;
-    }
-    QCheckBox::indicator {
-        border: 2px solid #3F3F46;
-        border-radius: 4px;
-        width: 18px;
-        height: 18px;
-        background: transparent;
-    }
-    QCheckBox::indicator:checked {
-        background-color: #3B82F6;
-        border-color: #3B82F6;
-    }
-    
-    /* LineEdit for File Paths */
-    QLineEdit {
-        background-color: #1C1C21;
-        border: 2px solid #27272A;
-        border-radius: 8px;
-        padding: 4px 8px;
-        color: #F4F4F5;
-        font-size: 10pt;
-    }
-    QLineEdit:focus {
-        border-color: #3B82F6;
-        background-color: #202025;
-    }
-"""
+VERIFY_CANCELLED_MSG = "Verification cancelled."
+VERIFY_STATUS_TIMEOUT_MS = 8000 # inline verification results clear after this long
+# --- Verification Result Patterns (matched against lower-cased yt-dlp output) ---
+# The extractor broke rather than the cookies; only these are worth a Playwright retry.
+PARSE_ERROR_PATTERNS = ("cannot parse data", "unable to extract")
+# The cookies are missing, invalid or expired.
+AUTH_ERROR_PATTERNS = ("login required", "this video is private", "sign in to confirm")
+# Page titles showing Playwright landed on a login wall.
+LOGIN_PAGE_TITLES = ("Login", "Log In")
+
+BROWSER_SOURCES = ["None", "chrome", "firefox", "opera", "edge", "brave", "vivaldi"]
+_browser_model = None
+
+def _browser_sources_model():
+    """Returns the single model shared by every browser source combo."""
+    global _browser_model
+    if _browser_model is None:
+        _browser_model = QStringListModel(BROWSER_SOURCES)
+    return _browser_model
+
+# --- Platform Credential Tabs ---
+# (key, label, icon file, description, cookies path placeholder, verification test URL)
+CREDENTIAL_TAB_SPECS = [
+    ('facebook', "Facebook", "facebook.png",
+     "For private or age-restricted content, you must be logged in.\nOption 1 (Preferred): Select a 'cookies.txt' file exported from your browser (Netscape format).\nOption 2: Select the browser where you are already logged into Facebook.",
+     "Path to cookies.txt...",
+     "https://www.facebook.com/watch/?v=10153231379986729"), # FB Test URL
+    ('pinterest', "Pinterest", "pinterest.png",
+     "Pinterest requires cookies for downloading high-res images and some videos.\nSelect your 'cookies.txt' or browser.",
+     "Path to pinterest cookies.txt...",
+     "https://www.pinterest.com/"), # Main page is usually sufficient for login check
+    ('tiktok', "TikTok", "tik-tok.png",
+     "TikTok generally works without cookies, but they help avoid CAPTCHAs and fetch more metadata.",
+     "Path to tiktok cookies.txt...",
+     "https://www.tiktok.com/@tiktok"),
+    ('youtube', "YouTube", "youtube.png",
+     "YouTube cookies are often required for age-restricted content or premium videos.\nSelect your 'cookies.txt' or browser.",
+     "Path to youtube cookies.txt...",
+     "https://www.youtube.com/watch?v=dQw4w9WgXcQ"), # Always public, good for basic check
+    ('instagram', "Instagram", "instagram.png",
+     "Instagram highly recommends cookies to avoid 'Login Required' blocks when scraping profiles or reels.\nSelect your 'cookies.txt' or browser.",
+     "Path to instagram cookies.txt...",
+     "https://www.instagram.com/instagram/"),
+]
+CREDENTIAL_TAB_LABELS = {spec[0]: spec[1] for spec in CREDENTIAL_TAB_SPECS}
+CREDENTIAL_TEST_URLS = {spec[0]: spec[5] for spec in CREDENTIAL_TAB_SPECS}
+
+# Resolved once at import; resource_path probes several roots per call
+_SOCIAL_ICON_DIR = os.path.join("app", "resources", "images", "icons", "social")
+_SOCIAL_ICON_PATHS = {
+    spec[2]: resource_path(os.path.join(_SOCIAL_ICON_DIR, spec[2])) for spec in CREDENTIAL_TAB_SPECS
+}
+_ICON_CACHE = {}
+
+def _social_icon(name):
+    """Returns a shared QIcon for a social icon file, decoding it only once."""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        path = _SOCIAL_ICON_PATHS.get(name) or resource_path(os.path.join(_SOCIAL_ICON_DIR, name))
+        icon = QIcon(path)
+        _ICON_CACHE[name] = icon
+    return icon
 
 class UpdateWorker(QThread):
     finished = Signal(bool, dict)
@@ -140,17 +91,173 @@ class UpdateWorker(QThread):
         available, info = check_for_updates()
         self.finished.emit(available, info if info else {})
 
-class CookieVerificationWorker(QThread):
+class _YdlLogCapture:
+    """Minimal yt-dlp logger that keeps messages in memory for inspection."""
+
+    def __init__(self):
+        self.messages = []
+        self.errors = []
+
+    def debug(self, msg):
+        self.messages.append(msg)
+
+    def info(self, msg):
+        self.messages.append(msg)
+
+    def warning(self, msg):
+        self.messages.append(msg)
+
+    def error(self, msg):
+        self.messages.append(msg)
+        self.errors.append(msg)
+
+
+class SaveSignals(QObject):
+    """
+    Defines the signals available from a running settings save.
+    """
+    finished = Signal(bool) # success
+
+
+class SaveSettingsWorker(QRunnable):
+    """
+    Writes a snapshot of the settings and credentials to disk off the UI thread.
+    """
+    def __init__(self, settings, credentials, credentials_manager):
+        super().__init__()
+        self.settings = settings
+        self.credentials = credentials
+        self.credentials_manager = credentials_manager
+        self.signals = SaveSignals()
+
+    @Slot()
+    def run(self):
+        success = save_settings(self.settings)
+        try:
+            self.credentials_manager.set_all(self.credentials)
+        except Exception as e:
+            logging.error(f"Failed to save credentials: {e}")
+            success = False
+        self.signals.finished.emit(success)
+
+
+def _probe_with_ytdlp(ydl_opts, test_url):
+    """
+    Runs yt-dlp metadata extraction for cookie verification (in the probe process).
+    Returns (status, messages, errors); status is None when yt-dlp returned
+    nothing, otherwise whether the result carries an id and a title.
+    """
+    import yt_dlp
+
+    # yt-dlp reports errors through the logger instead of stdout/stderr
+    ydl_log = _YdlLogCapture()
+    ydl_opts = dict(ydl_opts, logger=ydl_log)
+    info = None
+    try:
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(test_url, download=False)
+    except Exception as e:
+        # yt-dlp raises exceptions on failure even with ignoreerrors=True sometimes
+        ydl_log.error(str(e))
+
+    if info is None:
+        status = None
+    else:
+        status = bool(isinstance(info, dict) and info.get('id') and info.get('title'))
+    return status, ydl_log.messages, ydl_log.errors
+
+
+def _probe_server(conn):
+    """
+    Main loop of the probe process: answers each (ydl_opts, test_url) request
+    received on conn with the result of _probe_with_ytdlp; None ends it.
+    """
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        conn.send(_probe_with_ytdlp(*request))
+
+
+class _ProbeProcessDied(Exception):
+    pass
+
+
+class CookieVerificationWorker(QObject):
+    """
+    Verifies platform cookies. Lives on a single long-running QThread owned by
+    SettingsTab; each request arrives through the verify() slot and is answered
+    with one finished signal, so requests are processed in order.
+    """
     finished = Signal(bool, str)
 
-    def __init__(self, cookie_file=None, browser_source=None, test_url=None, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
+        self.cookie_file = None
+        self.browser_source = None
+        self.test_url = None
+        self._cancel_requested = threading.Event()
+        self._browser_used = False
+        self._probe_process = None
+        self._probe_conn = None
+
+    def cancel(self):
+        """Cancels the running and queued requests (thread-safe)."""
+        self._cancel_requested.set()
+
+    def reset_cancel(self):
+        self._cancel_requested.clear()
+
+    def _probe_channel(self):
+        """Returns the pipe to the probe process, (re)starting the process if needed."""
+        # One process keeps yt-dlp warm and isolated; requests are serialized by this thread
+        if self._probe_process is None or not self._probe_process.is_alive():
+            self._stop_probe_process()
+            ctx = multiprocessing.get_context('spawn')
+            self._probe_conn, child_conn = ctx.Pipe()
+            self._probe_process = ctx.Process(target=_probe_server, args=(child_conn,), daemon=True)
+            self._probe_process.start()
+            child_conn.close()
+        return self._probe_conn
+
+    def _stop_probe_process(self):
+        """Kills the probe process, even mid-probe, and waits for it to exit."""
+        if self._probe_process is not None:
+            self._probe_process.terminate()
+            self._probe_process.join()
+            self._probe_process = None
+        if self._probe_conn is not None:
+            self._probe_conn.close()
+            self._probe_conn = None
+
+    @Slot()
+    def shutdown(self):
+        """Stops the yt-dlp process and closes the Playwright browser kept warm between verifications."""
+        self._stop_probe_process()
+        if self._browser_used:
+            from app.platform_handler import close_reusable_browser
+            close_reusable_browser()
+            self._browser_used = False
+
+    @Slot(str, str, str)
+    def verify(self, cookie_file, browser_source, test_url):
         self.cookie_file = cookie_file
         self.browser_source = browser_source
         # Use provided test URL or default to Facebook (for backward compatibility if needed)
-        self.test_url = test_url if test_url else "https://www.facebook.com/watch/?v=10153231379986729"
+        self.test_url = test_url if test_url else CREDENTIAL_TEST_URLS['facebook']
+        if self._cancel_requested.is_set():
+            self.finished.emit(False, VERIFY_CANCELLED_MSG)
+            return
+        self.run()
 
     def run(self):
+        # Deferred import: Playwright (via platform_handler) is heavy and only
+        # needed once the user actually verifies cookies.
+        from app.platform_handler import extract_metadata_with_playwright
+
         # 1. Preliminary Check: Critical Cookies
         if self.cookie_file and os.path.exists(self.cookie_file):
             missing = self.check_critical_cookies(self.cookie_file, self.test_url)
@@ -165,7 +272,13 @@ class CookieVerificationWorker(QThread):
             'noplaylist': True,
             'ignoreerrors': True,
             'no_warnings': True,
-            'dump_single_json': True,
+            # Fail fast: a verify is a single probe, retries only stretch out a dead cookie
+            'retries': 0,
+            'fragment_retries': 0,
+            'extractor_retries': 0,
+            'socket_timeout': 10,
+            'cachedir': False,
+            'no_color': True,
         }
 
         logging.info(f"Starting cookie verification. File: '{self.cookie_file}', Browser: '{self.browser_source}'")
@@ -189,57 +302,64 @@ class CookieVerificationWorker(QThread):
             return
 
         try:
-            # Capture output using tempfile instead of pipe to avoid Windows buffering issues
-            with tempfile.TemporaryFile(mode='w+', encoding='utf-8') as tmp_out, \
-                 tempfile.TemporaryFile(mode='w+', encoding='utf-8') as tmp_err:
-                
-                original_stdout = sys.stdout
-                original_stderr = sys.stderr
-                
-                try:
-                    sys.stdout = tmp_out
-                    sys.stderr = tmp_err
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.extract_info(self.test_url, download=False)
-                except Exception:
-                    # yt-dlp raises exceptions on failure even with ignoreerrors=True sometimes
-                    pass
-                finally:
-                    sys.stdout = original_stdout # Restore stdout
-                    sys.stderr = original_stderr # Restore stderr
-                
-                tmp_out.seek(0)
-                output = tmp_out.read()
-                
-                tmp_err.seek(0)
-                error_output = tmp_err.read()
-
-            logging.debug(f"Verification Output: {output[:500]}...")
+            conn = self._probe_channel()
+            conn.send((ydl_opts, self.test_url))
+            while not conn.poll(0.2):
+                if self._cancel_requested.is_set():
+                    # Kill the running probe so neither the next verify nor
+                    # quitting the app waits for yt-dlp to finish
+                    self._stop_probe_process()
+                    self.finished.emit(False, VERIFY_CANCELLED_MSG)
+                    return
+                if not self._probe_process.is_alive():
+                    raise _ProbeProcessDied(f"exit code {self._probe_process.exitcode}")
+            status, messages, errors = conn.recv()
+
+            output = "\n".join(messages)
+            error_output = "\n".join(errors)
             if error_output:
                 logging.error(f"Verification Stderr: {error_output}")
-            
-            # Check if JSON output indicates success
-            if output.strip() and ('"id":' in output and '"title":' in output):
+
+            # The probe reports whether the extracted info had an id and title
+            if status:
                 self.finished.emit(True, "Cookies are valid! Accessed test video via yt-dlp.")
                 return
-            
+
+            if status is not None:
+                # yt-dlp reached the page but returned no usable metadata
+                self.finished.emit(False, "Verification failed: yt-dlp returned no video metadata. Check cookies.")
+                return
+
             # --- FALLBACK: Playwright Verification ---
-            # If yt-dlp failed (likely "Cannot parse data"), try Playwright to confirm accessibility
+            # Launching a browser is expensive, so only fall back when yt-dlp failed to
+            # parse the page; auth errors won't improve in a browser either.
+            output_lower = output.lower()
+            if any(pattern in output_lower for pattern in AUTH_ERROR_PATTERNS):
+                self.finished.emit(False, "Verification failed: Cookies invalid or expired.")
+                return
+            if not any(pattern in output_lower for pattern in PARSE_ERROR_PATTERNS):
+                clean_err = error_output.strip() if error_output else "Unknown error"
+                self.finished.emit(False, f"Verification failed. yt-dlp error: {clean_err[:300]}")
+                return
+
+            if self._cancel_requested.is_set():
+                self.finished.emit(False, VERIFY_CANCELLED_MSG)
+                return
+
             logging.info("yt-dlp verification failed. Attempting Playwright fallback...")
-            
-            # We only try fallback if the error suggests parsing issues, not auth issues
-            # But generally, if we can reach the site, it's 'Good Enough' for our Playwright-based scrapers
-            
+
             settings = {}
             if self.cookie_file and os.path.exists(self.cookie_file):
                 settings['cookie_file'] = self.cookie_file
             
-            pw_results = extract_metadata_with_playwright(self.test_url, settings=settings)
+            # Keep the browser warm on this thread so repeat verifies skip the Chromium launch
+            self._browser_used = True
+            pw_results = extract_metadata_with_playwright(self.test_url, settings=settings, reuse_browser=True)
             if pw_results and pw_results[0].get('type') != 'error':
                 # Check if we got valid-looking data (not just a login page title)
                 first_res = pw_results[0]
                 title = first_res.get('title', '')
-                if "Login" in title or "Log In" in title:
+                if any(login in title for login in LOGIN_PAGE_TITLES):
                      self.finished.emit(False, "Verification failed: Page redirects to Login. Check cookies.")
                 elif "Instagram" == title: # Suspiciously generic title
                      # It might be the login page wrapper.
@@ -248,14 +368,17 @@ class CookieVerificationWorker(QThread):
                      self.finished.emit(True, "Verified via Browser (Playwright). yt-dlp parsing failed, but site is accessible.")
             else:
                 # Use the original yt-dlp error if Playwright also fails
-                if "Cannot parse data" in output or "Cannot parse data" in error_output:
+                if "cannot parse data" in output_lower:
                      self.finished.emit(False, "Verification failed: yt-dlp could not parse Facebook data. This is a known issue with recent Facebook updates.")
-                elif "Login required" in output or "This video is private" in output:
-                     self.finished.emit(False, "Verification failed: Cookies invalid or expired.")
                 else:
                      clean_err = error_output.strip() if error_output else "Unknown error"
                      self.finished.emit(False, f"Verification failed. yt-dlp error: {clean_err[:300]}")
 
+        except (_ProbeProcessDied, EOFError, OSError) as e:
+            # Start a fresh process on the next request
+            self._stop_probe_process()
+            logging.error(f"Verification process died: {e}")
+            self.finished.emit(False, f"Verification failed with error: {e}")
         except Exception as e:
             logging.error(f"Verification failed with exception: {e}")
             self.finished.emit(False, f"Verification failed with error: {e}")
@@ -291,17 +414,39 @@ class CookieVerificationWorker(QThread):
 
 
 class SettingsTab(QWidget):
+    verify_requested = Signal(str, str, str) # cookie_file, browser_source, test_url
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.credentials_manager = CredentialsManager()
 
+        # --- Cookie Verification Worker ---
+        # One persistent thread serves every verify click; it is started on first use.
+        self._verify_thread = QThread(self)
+        self._verify_worker = CookieVerificationWorker()
+        self._verify_worker.moveToThread(self._verify_thread)
+        # Both directions cross threads, so say so up front instead of letting Qt
+        # resolve AutoConnection on every emission.
+        self.verify_requested.connect(self._verify_worker.verify, Qt.QueuedConnection)
+        self._verify_worker.finished.connect(self.on_cookie_verification_finished, Qt.QueuedConnection)
+        # Runs on the verify thread itself, which owns the worker's probe process and cached browser
+        self._verify_thread.finished.connect(self._verify_worker.shutdown, Qt.DirectConnection)
+        self._verify_thread.finished.connect(self._verify_worker.deleteLater)
+        self._pending_verify_btns = deque() # (button, original_text) per queued request
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stop_verify_thread)
+
+        # Saves run one at a time so settings.json writes never interleave
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
         
-        label_style = "color: #A1A1AA; font-weight: 600; background-color: transparent;"
-        
-        self.setStyleSheet(INPUT_STYLE) # Apply globally
+        # Styled by the QWidget#SettingsTab rules in styles.qss
+        self.setObjectName("SettingsTab")
 
         # --- Global Settings ---
         global_settings_layout = QHBoxLayout()
@@ -330,8 +475,7 @@ class SettingsTab(QWidget):
         
         # Resolution Row
         res_layout = QHBoxLayout()
-        res_label = QLabel("Resolution:")
-        res_label.setStyleSheet(label_style)
+        res_label = self._field_label("Resolution:")
         
         self.video_res_combo = QComboBox()
         self.video_res_combo.addItems(["Best Available", "4K", "1080p", "720p", "480p", "360p"])
@@ -370,8 +514,7 @@ class SettingsTab(QWidget):
         
         # Resolution (Quality) Row
         photo_res_layout = QHBoxLayout()
-        photo_res_label = QLabel("Quality:")
-        photo_res_label.setStyleSheet(label_style)
+        photo_res_label = self._field_label("Quality:")
         
         self.photo_res_combo = QComboBox()
         self.photo_res_combo.addItems(["Best Available", "High", "Medium", "Low"])
@@ -393,273 +536,67 @@ class SettingsTab(QWidget):
 
         # Global Header
         global_header = QLabel("Global Settings")
-        global_header.setStyleSheet("color: #3B82F6; font-size: 12pt; font-weight: bold; margin-bottom: 2px;")
+        global_header.setObjectName("SettingsSectionHeader")
+        global_header.setProperty("first", True)
         layout.addWidget(global_header)
 
         layout.addLayout(global_settings_layout)
 
         # Platform Credentials Header
         cred_header = QLabel("Platform Credentials")
-        cred_header.setStyleSheet("color: #3B82F6; font-size: 12pt; font-weight: bold; margin-bottom: 2px; margin-top: 15px;")
+        cred_header.setObjectName("SettingsSectionHeader")
         layout.addWidget(cred_header)
 
         credentials_group = QGroupBox()
-        credentials_group.setStyleSheet("QGroupBox { margin-top: 0px; }")
+        credentials_group.setObjectName("SettingsUntitledGroup")
         cred_layout = QVBoxLayout()
         
         self.credentials_tabs = QTabWidget()
         self.credentials_tabs.setIconSize(QSize(20, 20))
-        # Use os.path.join for correct path construction
-        icon_base_path = resource_path(os.path.join("app", "resources", "images", "icons", "social"))
-        
-        # --- Facebook Credentials Tab ---
-        facebook_tab = QWidget()
-        fb_layout = QVBoxLayout(facebook_tab)
-        fb_layout.setSpacing(8)
-        fb_layout.setContentsMargins(10, 10, 10, 10)
-        
-        fb_desc = QLabel("For private or age-restricted content, you must be logged in.\nOption 1 (Preferred): Select a 'cookies.txt' file exported from your browser (Netscape format).\nOption 2: Select the browser where you are already logged into Facebook.")
-        fb_desc.setStyleSheet("color: #A1A1AA; font-size: 9pt; margin-bottom: 10px;")
-        fb_desc.setWordWrap(True)
-        fb_layout.addWidget(fb_desc)
-        
-        # Cookies File Option
-        fb_cookies_layout = QHBoxLayout()
-        self.fb_cookies_path = QLineEdit()
-        self.fb_cookies_path.setPlaceholderText("Path to cookies.txt...")
-        self.fb_cookies_btn = QPushButton("Browse...")
-        self.fb_cookies_btn.clicked.connect(self.browse_fb_cookies)
-        self.fb_cookies_btn.setStyleSheet("background-color: #27272A; color: #F4F4F5; border: 1px solid #3F3F46; border-radius: 6px; padding: 5px 10px;")
-        
-        fb_cookies_layout.addWidget(QLabel("Cookies File:"))
-        fb_cookies_layout.addWidget(self.fb_cookies_path)
-        fb_cookies_layout.addWidget(self.fb_cookies_btn)
-        fb_layout.addLayout(fb_cookies_layout)
 
-        # Browser Option
-        fb_browser_layout = QHBoxLayout()
-        self.fb_browser_combo = QComboBox()
-        self.fb_browser_combo.addItems(["None", "chrome", "firefox", "opera", "edge", "brave", "vivaldi"])
-        
-        fb_browser_layout.addWidget(QLabel("Browser Source:"))
-        fb_browser_layout.addWidget(self.fb_browser_combo)
-        fb_browser_layout.addStretch()
-        fb_layout.addLayout(fb_browser_layout)
-        
-        # --- Verify Cookies Button ---
-        verify_btn_layout = QHBoxLayout()
-        self.verify_fb_cookies_btn = QPushButton("Verify Cookies")
-        self.verify_fb_cookies_btn.clicked.connect(self.verify_fb_cookies)
-        self.verify_fb_cookies_btn.setStyleSheet(VERIFY_BTN_STYLE)
-        verify_btn_layout.addStretch()
-        verify_btn_layout.addWidget(self.verify_fb_cookies_btn)
-        fb_layout.addLayout(verify_btn_layout)
-        
-        fb_layout.addStretch()
-        self.credentials_tabs.addTab(facebook_tab, QIcon(os.path.join(icon_base_path, "facebook.png")), "Facebook")
-        
-        # --- Pinterest Credentials Tab ---
-        pinterest_tab = QWidget()
-        pin_layout = QVBoxLayout(pinterest_tab)
-        pin_layout.setSpacing(8)
-        pin_layout.setContentsMargins(10, 10, 10, 10)
-        
-        pin_desc = QLabel("Pinterest requires cookies for downloading high-res images and some videos.\nSelect your 'cookies.txt' or browser.")
-        pin_desc.setStyleSheet("color: #A1A1AA; font-size: 9pt; margin-bottom: 10px;")
-        pin_desc.setWordWrap(True)
-        pin_layout.addWidget(pin_desc)
-        
-        # Pinterest Cookies File
-        pin_cookies_layout = QHBoxLayout()
-        self.pin_cookies_path = QLineEdit()
-        self.pin_cookies_path.setPlaceholderText("Path to pinterest cookies.txt...")
-        self.pin_cookies_btn = QPushButton("Browse...")
-        self.pin_cookies_btn.clicked.connect(self.browse_pin_cookies)
-        self.pin_cookies_btn.setStyleSheet("background-color: #27272A; color: #F4F4F5; border: 1px solid #3F3F46; border-radius: 6px; padding: 5px 10px;")
-        
-        pin_cookies_layout.addWidget(QLabel("Cookies File:"))
-        pin_cookies_layout.addWidget(self.pin_cookies_path)
-        pin_cookies_layout.addWidget(self.pin_cookies_btn)
-        pin_layout.addLayout(pin_cookies_layout)
-
-        # Pinterest Browser Option
-        pin_browser_layout = QHBoxLayout()
-        self.pin_browser_combo = QComboBox()
-        self.pin_browser_combo.addItems(["None", "chrome", "firefox", "opera", "edge", "brave", "vivaldi"])
-        
-        pin_browser_layout.addWidget(QLabel("Browser Source:"))
-        pin_browser_layout.addWidget(self.pin_browser_combo)
-        pin_browser_layout.addStretch()
-        pin_layout.addLayout(pin_browser_layout)
-        
-        # Verify Pinterest Button
-        verify_pin_layout = QHBoxLayout()
-        self.verify_pin_cookies_btn = QPushButton("Verify Cookies")
-        self.verify_pin_cookies_btn.clicked.connect(self.verify_pin_cookies)
-        self.verify_pin_cookies_btn.setStyleSheet(VERIFY_BTN_STYLE)
-        verify_pin_layout.addStretch()
-        verify_pin_layout.addWidget(self.verify_pin_cookies_btn)
-        pin_layout.addLayout(verify_pin_layout)
-        
-        pin_layout.addStretch()
-        self.credentials_tabs.addTab(pinterest_tab, QIcon(os.path.join(icon_base_path, "pinterest.png")), "Pinterest")
-
-        # --- TikTok Credentials Tab ---
-        tiktok_tab = QWidget()
-        tt_layout = QVBoxLayout(tiktok_tab)
-        tt_layout.setSpacing(8)
-        tt_layout.setContentsMargins(10, 10, 10, 10)
-        
-        tt_desc = QLabel("TikTok generally works without cookies, but they help avoid CAPTCHAs and fetch more metadata.")
-        tt_desc.setStyleSheet("color: #A1A1AA; font-size: 9pt; margin-bottom: 10px;")
-        tt_desc.setWordWrap(True)
-        tt_layout.addWidget(tt_desc)
-        
-        # TikTok Cookies File
-        tt_cookies_layout = QHBoxLayout()
-        self.tt_cookies_path = QLineEdit()
-        self.tt_cookies_path.setPlaceholderText("Path to tiktok cookies.txt...")
-        self.tt_cookies_btn = QPushButton("Browse...")
-        self.tt_cookies_btn.clicked.connect(self.browse_tt_cookies)
-        self.tt_cookies_btn.setStyleSheet("background-color: #27272A; color: #F4F4F5; border: 1px solid #3F3F46; border-radius: 6px; padding: 5px 10px;")
-        
-        tt_cookies_layout.addWidget(QLabel("Cookies File:"))
-        tt_cookies_layout.addWidget(self.tt_cookies_path)
-        tt_cookies_layout.addWidget(self.tt_cookies_btn)
-        tt_layout.addLayout(tt_cookies_layout)
-
-        # TikTok Browser Option
-        tt_browser_layout = QHBoxLayout()
-        self.tt_browser_combo = QComboBox()
-        self.tt_browser_combo.addItems(["None", "chrome", "firefox", "opera", "edge", "brave", "vivaldi"])
-        
-        tt_browser_layout.addWidget(QLabel("Browser Source:"))
-        tt_browser_layout.addWidget(self.tt_browser_combo)
-        tt_browser_layout.addStretch()
-        tt_layout.addLayout(tt_browser_layout)
-        
-        # Verify TikTok Button
-        verify_tt_layout = QHBoxLayout()
-        self.verify_tt_cookies_btn = QPushButton("Verify Cookies")
-        self.verify_tt_cookies_btn.clicked.connect(self.verify_tt_cookies)
-        self.verify_tt_cookies_btn.setStyleSheet(VERIFY_BTN_STYLE)
-        verify_tt_layout.addStretch()
-        verify_tt_layout.addWidget(self.verify_tt_cookies_btn)
-        tt_layout.addLayout(verify_tt_layout)
-        
-        tt_layout.addStretch()
-        self.credentials_tabs.addTab(tiktok_tab, QIcon(os.path.join(icon_base_path, "tik-tok.png")), "TikTok")
-        
-        # --- YouTube Credentials Tab ---
-        youtube_tab = QWidget()
-        yt_layout = QVBoxLayout(youtube_tab)
-        yt_layout.setSpacing(8)
-        yt_layout.setContentsMargins(10, 10, 10, 10)
-        
-        yt_desc = QLabel("YouTube cookies are often required for age-restricted content or premium videos.\nSelect your 'cookies.txt' or browser.")
-        yt_desc.setStyleSheet("color: #A1A1AA; font-size: 9pt; margin-bottom: 10px;")
-        yt_desc.setWordWrap(True)
-        yt_layout.addWidget(yt_desc)
-        
-        # YouTube Cookies File
-        yt_cookies_layout = QHBoxLayout()
-        self.yt_cookies_path = QLineEdit()
-        self.yt_cookies_path.setPlaceholderText("Path to youtube cookies.txt...")
-        self.yt_cookies_btn = QPushButton("Browse...")
-        self.yt_cookies_btn.clicked.connect(self.browse_yt_cookies)
-        self.yt_cookies_btn.setStyleSheet("background-color: #27272A; color: #F4F4F5; border: 1px solid #3F3F46; border-radius: 6px; padding: 5px 10px;")
-        
-        yt_cookies_layout.addWidget(QLabel("Cookies File:"))
-        yt_cookies_layout.addWidget(self.yt_cookies_path)
-        yt_cookies_layout.addWidget(self.yt_cookies_btn)
-        yt_layout.addLayout(yt_cookies_layout)
-
-        # YouTube Browser Option
-        yt_browser_layout = QHBoxLayout()
-        self.yt_browser_combo = QComboBox()
-        self.yt_browser_combo.addItems(["None", "chrome", "firefox", "opera", "edge", "brave", "vivaldi"])
-        
-        yt_browser_layout.addWidget(QLabel("Browser Source:"))
-        yt_browser_layout.addWidget(self.yt_browser_combo)
-        yt_browser_layout.addStretch()
-        yt_layout.addLayout(yt_browser_layout)
-        
-        # Verify YouTube Button
-        verify_yt_layout = QHBoxLayout()
-        self.verify_yt_cookies_btn = QPushButton("Verify Cookies")
-        self.verify_yt_cookies_btn.clicked.connect(self.verify_yt_cookies)
-        self.verify_yt_cookies_btn.setStyleSheet(VERIFY_BTN_STYLE)
-        verify_yt_layout.addStretch()
-        verify_yt_layout.addWidget(self.verify_yt_cookies_btn)
-        yt_layout.addLayout(verify_yt_layout)
-        
-        yt_layout.addStretch()
-        self.credentials_tabs.addTab(youtube_tab, QIcon(os.path.join(icon_base_path, "youtube.png")), "YouTube")
-
-        # --- Instagram Credentials Tab ---
-        instagram_tab = QWidget()
-        ig_layout = QVBoxLayout(instagram_tab)
-        ig_layout.setSpacing(8)
-        ig_layout.setContentsMargins(10, 10, 10, 10)
-        
-        ig_desc = QLabel("Instagram highly recommends cookies to avoid 'Login Required' blocks when scraping profiles or reels.\nSelect your 'cookies.txt' or browser.")
-        ig_desc.setStyleSheet("color: #A1A1AA; font-size: 9pt; margin-bottom: 10px;")
-        ig_desc.setWordWrap(True)
-        ig_layout.addWidget(ig_desc)
-        
-        # Instagram Cookies File
-        ig_cookies_layout = QHBoxLayout()
-        self.ig_cookies_path = QLineEdit()
-        self.ig_cookies_path.setPlaceholderText("Path to instagram cookies.txt...")
-        self.ig_cookies_btn = QPushButton("Browse...")
-        self.ig_cookies_btn.clicked.connect(self.browse_ig_cookies)
-        self.ig_cookies_btn.setStyleSheet("background-color: #27272A; color: #F4F4F5; border: 1px solid #3F3F46; border-radius: 6px; padding: 5px 10px;")
-        
-        ig_cookies_layout.addWidget(QLabel("Cookies File:"))
-        ig_cookies_layout.addWidget(self.ig_cookies_path)
-        ig_cookies_layout.addWidget(self.ig_cookies_btn)
-        ig_layout.addLayout(ig_cookies_layout)
-
-        # Instagram Browser Option
-        ig_browser_layout = QHBoxLayout()
-        self.ig_browser_combo = QComboBox()
-        self.ig_browser_combo.addItems(["None", "chrome", "firefox", "opera", "edge", "brave", "vivaldi"])
-        
-        ig_browser_layout.addWidget(QLabel("Browser Source:"))
-        ig_browser_layout.addWidget(self.ig_browser_combo)
-        ig_browser_layout.addStretch()
-        ig_layout.addLayout(ig_browser_layout)
-        
-        # Verify Instagram Button
-        verify_ig_layout = QHBoxLayout()
-        self.verify_ig_cookies_btn = QPushButton("Verify Cookies")
-        self.verify_ig_cookies_btn.clicked.connect(self.verify_ig_cookies)
-        self.verify_ig_cookies_btn.setStyleSheet(VERIFY_BTN_STYLE)
-        verify_ig_layout.addStretch()
-        verify_ig_layout.addWidget(self.verify_ig_cookies_btn)
-        ig_layout.addLayout(verify_ig_layout)
-        
-        ig_layout.addStretch()
-        self.credentials_tabs.addTab(instagram_tab, QIcon(os.path.join(icon_base_path, "instagram.png")), "Instagram")
-        
+        # --- Platform Credential Tabs ---
+        self.cookie_path_inputs = {} # platform -> QLineEdit
+        self.browser_combos = {}     # platform -> QComboBox
+        self.verify_buttons = {}     # platform -> QPushButton
+        self.verify_status_labels = {} # platform -> QLabel
+        self._verify_status_timers = {} # platform -> QTimer clearing the status label
+        # Only the first tab is built up front; the rest are built the first time they are shown
+        self._saved_credentials = {}    # platform -> stored credentials, applied as tabs are built
+        self._unbuilt_credential_tabs = {} # tab index -> (placeholder layout, spec)
+        for index, spec in enumerate(CREDENTIAL_TAB_SPECS):
+            label, icon_file = spec[1], spec[2]
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self.credentials_tabs.addTab(placeholder, _social_icon(icon_file), label)
+            self._unbuilt_credential_tabs[index] = (placeholder_layout, spec)
+        self._materialize_credential_tab(self.credentials_tabs.currentIndex())
+        self.credentials_tabs.currentChanged.connect(self._materialize_credential_tab)
+
         cred_layout.addWidget(self.credentials_tabs)
+
+        self.cancel_verify_btn = QPushButton("Cancel Verification")
+        self.cancel_verify_btn.setObjectName("SettingsBrowseButton")
+        self.cancel_verify_btn.clicked.connect(self.cancel_verification)
+        self.cancel_verify_btn.hide()
+        cred_layout.addWidget(self.cancel_verify_btn, alignment=Qt.AlignRight)
         credentials_group.setLayout(cred_layout)
 
         layout.addWidget(credentials_group)
 
         # --- Update Section ---
         update_header = QLabel("Software Updates")
-        update_header.setStyleSheet("color: #3B82F6; font-size: 12pt; font-weight: bold; margin-bottom: 2px; margin-top: 15px;")
+        update_header.setObjectName("SettingsSectionHeader")
         layout.addWidget(update_header)
 
         update_group = QGroupBox()
-        update_group.setStyleSheet("QGroupBox { margin-top: 0px; }")
+        update_group.setObjectName("SettingsUntitledGroup")
         update_layout = QHBoxLayout()
         update_layout.setContentsMargins(15, 15, 15, 15)
 
         version_info_layout = QVBoxLayout()
         self.current_version_label = QLabel(f"Current Version: v{VERSION}")
-        self.current_version_label.setStyleSheet("color: #F4F4F5; font-size: 10pt; font-weight: bold;")
+        self.current_version_label.setObjectName("SettingsVersionLabel")
         
         self.update_status_label = QLabel("Your software is up to date.")
         self.update_status_label.setStyleSheet("color: #71717A; font-size: 9pt;")
@@ -671,7 +608,7 @@ class SettingsTab(QWidget):
         update_layout.addStretch()
         
         self.check_update_btn = QPushButton("Check for Updates")
-        self.check_update_btn.setStyleSheet(UPDATE_BTN_STYLE)
+        self.check_update_btn.setObjectName("SettingsUpdateButton")
         self.check_update_btn.clicked.connect(self.run_update_check)
         update_layout.addWidget(self.check_update_btn)
         
@@ -679,13 +616,31 @@ class SettingsTab(QWidget):
         layout.addWidget(update_group)
 
         # Save Button
-        save_btn = QPushButton("Save Settings")
-        save_btn.setStyleSheet(SAVE_BTN_STYLE)
-        save_btn.clicked.connect(self.save_current_settings)
-        layout.addWidget(save_btn)
+        self.save_btn = QPushButton("Save Settings")
+        self.save_btn.setObjectName("SettingsSaveButton")
+        self.save_btn.clicked.connect(self.save_current_settings)
+        layout.addWidget(self.save_btn)
         
         layout.addStretch() # Pushes the group to the top
-        
+
+        # Global settings schema: (settings path, getter, setter, default).
+        # get_settings and set_settings both walk this list, so they cannot drift apart.
+        self._combo_index_maps = {} # combo model -> {item text: index}
+        self._settings_schema = [
+            (('video', 'enabled'), self.enable_video_chk.isChecked, self.enable_video_chk.setChecked, False),
+            (('video', 'top'), self.top_video_chk.isChecked, self.top_video_chk.setChecked, False),
+            (('video', 'count'), self.top_video_count.value, self.top_video_count.setValue, 5),
+            (('video', 'all'), self.all_video_chk.isChecked, self.all_video_chk.setChecked, False),
+            (('video', 'resolution'), self.video_res_combo.currentText,
+             lambda text: self._set_combo_text(self.video_res_combo, text), "Best Available"),
+            (('photo', 'enabled'), self.enable_photo_chk.isChecked, self.enable_photo_chk.setChecked, False),
+            (('photo', 'top'), self.top_photo_chk.isChecked, self.top_photo_chk.setChecked, False),
+            (('photo', 'count'), self.top_photo_count.value, self.top_photo_count.setValue, 5),
+            (('photo', 'all'), self.all_photo_chk.isChecked, self.all_photo_chk.setChecked, False),
+            (('photo', 'quality'), self.photo_res_combo.currentText,
+             lambda text: self._set_combo_text(self.photo_res_combo, text), "Best Available"),
+        ]
+
         # Load initial settings
         self.load_initial_settings()
 
@@ -725,167 +680,212 @@ class SettingsTab(QWidget):
             # But the button is manual anyway.
             QMessageBox.information(self, "No Updates", "You are already using the latest version.")
 
-    def browse_fb_cookies(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Cookies File", "", "Text Files (*.txt);;All Files (*)")
-        if path:
-            self.fb_cookies_path.setText(path)
+    def _field_label(self, text):
+        """Returns a form label styled by the QLabel#SettingsFieldLabel rule."""
+        label = QLabel(text)
+        label.setObjectName("SettingsFieldLabel")
+        return label
 
-    def browse_pin_cookies(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Pinterest Cookies File", "", "Text Files (*.txt);;All Files (*)")
-        if path:
-            self.pin_cookies_path.setText(path)
+    def _build_credential_tab(self, key, label, icon_file, description, placeholder, test_url):
+        """Builds the credentials tab for one platform and registers its input widgets."""
+        tab = QWidget()
+        tab_layout = QVBoxLayout(tab)
+        tab_layout.setSpacing(8)
+        tab_layout.setContentsMargins(10, 10, 10, 10)
 
-    def browse_tt_cookies(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select TikTok Cookies File", "", "Text Files (*.txt);;All Files (*)")
-        if path:
-            self.tt_cookies_path.setText(path)
+        desc_label = QLabel(description)
+        desc_label.setObjectName("SettingsHintLabel")
+        desc_label.setWordWrap(True)
+        tab_layout.addWidget(desc_label)
 
-    def browse_yt_cookies(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select YouTube Cookies File", "", "Text Files (*.txt);;All Files (*)")
-        if path:
-            self.yt_cookies_path.setText(path)
+        # Cookies File Option
+        cookies_layout = QHBoxLayout()
+        cookies_path = QLineEdit()
+        cookies_path.setPlaceholderText(placeholder)
+        browse_btn = QPushButton("Browse...")
+        browse_btn.setProperty("platform", key)
+        browse_btn.clicked.connect(self._on_browse_clicked)
+        browse_btn.setObjectName("SettingsBrowseButton")
+
+        cookies_layout.addWidget(self._field_label("Cookies File:"))
+        cookies_layout.addWidget(cookies_path)
+        cookies_layout.addWidget(browse_btn)
+        tab_layout.addLayout(cookies_layout)
 
-    def browse_ig_cookies(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Instagram Cookies File", "", "Text Files (*.txt);;All Files (*)")
-        if path:
-            self.ig_cookies_path.setText(path)
+        # Browser Option
+        browser_layout = QHBoxLayout()
+        browser_combo = QComboBox()
+        browser_combo.setModel(_browser_sources_model())
 
-    @Slot()
-    def verify_fb_cookies(self):
-        cookie_file = self.fb_cookies_path.text()
-        browser_source = self.fb_browser_combo.currentText()
-        test_url = "https://www.facebook.com/watch/?v=10153231379986729" # FB Test URL
-        self._verify_cookies(cookie_file, browser_source, test_url, self.verify_fb_cookies_btn)
+        browser_layout.addWidget(self._field_label("Browser Source:"))
+        browser_layout.addWidget(browser_combo)
+        browser_layout.addStretch()
+        tab_layout.addLayout(browser_layout)
 
-    @Slot()
-    def verify_pin_cookies(self):
-        cookie_file = self.pin_cookies_path.text()
-        browser_source = self.pin_browser_combo.currentText()
-        test_url = "https://www.pinterest.com/" # Pinterest Test URL (Main page is usually sufficient for login check)
-        self._verify_cookies(cookie_file, browser_source, test_url, self.verify_pin_cookies_btn)
+        # Verify Cookies Button
+        verify_btn_layout = QHBoxLayout()
+        verify_btn = QPushButton("Verify Cookies")
+        verify_btn.setProperty("platform", key)
+        verify_btn.clicked.connect(self._on_verify_clicked)
+        verify_btn.setObjectName("SettingsVerifyButton")
+
+        # Inline result instead of a modal box, so queued results never wait on a click
+        status_label = QLabel("")
+        status_label.setObjectName("SettingsVerifyStatus")
+        status_label.setWordWrap(True)
+        status_timer = QTimer(status_label)
+        status_timer.setSingleShot(True)
+        status_timer.setInterval(VERIFY_STATUS_TIMEOUT_MS)
+        status_timer.timeout.connect(status_label.clear)
+
+        verify_btn_layout.addWidget(status_label, 1)
+        verify_btn_layout.addWidget(verify_btn)
+        tab_layout.addLayout(verify_btn_layout)
+
+        tab_layout.addStretch()
+
+        self.cookie_path_inputs[key] = cookies_path
+        self.browser_combos[key] = browser_combo
+        self.verify_buttons[key] = verify_btn
+        self.verify_status_labels[key] = status_label
+        self._verify_status_timers[key] = status_timer
+        return tab
+
+    @Slot(int)
+    def _materialize_credential_tab(self, index):
+        """Builds a credential tab's contents the first time it is shown."""
+        pending = self._unbuilt_credential_tabs.pop(index, None)
+        if pending is None:
+            return
+        placeholder_layout, spec = pending
+        placeholder_layout.addWidget(self._build_credential_tab(*spec))
+        self._apply_saved_credentials(spec[0])
 
+    # Every tab's Browse/Verify button shares one slot; the platform rides on the button
     @Slot()
-    def verify_tt_cookies(self):
-        cookie_file = self.tt_cookies_path.text()
-        browser_source = self.tt_browser_combo.currentText()
-        test_url = "https://www.tiktok.com/@tiktok" # TikTok Test URL
-        self._verify_cookies(cookie_file, browser_source, test_url, self.verify_tt_cookies_btn)
+    def _on_browse_clicked(self):
+        self.browse_cookies(self.sender().property("platform"))
 
     @Slot()
-    def verify_yt_cookies(self):
-        cookie_file = self.yt_cookies_path.text()
-        browser_source = self.yt_browser_combo.currentText()
-        test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ" # YouTube Test URL (Rick Roll - always public, good for basic check)
-        self._verify_cookies(cookie_file, browser_source, test_url, self.verify_yt_cookies_btn)
+    def _on_verify_clicked(self):
+        self.verify_platform_cookies(self.sender().property("platform"))
 
-    @Slot()
-    def verify_ig_cookies(self):
-        cookie_file = self.ig_cookies_path.text()
-        browser_source = self.ig_browser_combo.currentText()
-        test_url = "https://www.instagram.com/instagram/" # Instagram Test URL
-        self._verify_cookies(cookie_file, browser_source, test_url, self.verify_ig_cookies_btn)
+    def browse_cookies(self, key):
+        label = CREDENTIAL_TAB_LABELS[key]
+        path, _ = QFileDialog.getOpenFileName(self, f"Select {label} Cookies File", "", "Text Files (*.txt);;All Files (*)")
+        if path:
+            self.cookie_path_inputs[key].setText(path)
+
+    def verify_platform_cookies(self, key):
+        cookie_file = self.cookie_path_inputs[key].text()
+        browser_source = self.browser_combos[key].currentText()
+        test_url = CREDENTIAL_TEST_URLS[key]
+        self._verify_cookies(key, cookie_file, browser_source, test_url)
 
-    def _verify_cookies(self, cookie_file, browser_source, test_url, btn_widget):
+    def _verify_cookies(self, key, cookie_file, browser_source, test_url):
         if not cookie_file and (not browser_source or browser_source == "None"):
-            QMessageBox.warning(self, "Verification Failed", "Please provide a cookie file or select a browser source.")
+            self._show_verify_status(key, False, "Please provide a cookie file or select a browser source.")
+            return
+
+        # Reject missing or empty cookie files here, before queueing work for the verify thread
+        if cookie_file and (not os.path.isfile(cookie_file) or os.path.getsize(cookie_file) == 0):
+            self._show_verify_status(key, False, f"Cookie file not found or empty: {cookie_file}")
             return
 
+        btn_widget = self.verify_buttons[key]
         btn_widget.setEnabled(False)
         original_text = btn_widget.text()
         btn_widget.setText("Verifying...")
-        
-        # Store reference to button to restore it later
-        self.active_verify_btn = btn_widget
-        self.active_verify_btn_text = original_text
+        self._show_verify_status(key, None, "")
+
+        # Remember which platform asked, to restore its button later (answers arrive in request order)
+        self._pending_verify_btns.append((key, original_text))
 
-        self.cookie_worker = CookieVerificationWorker(cookie_file, browser_source, test_url, self)
-        self.cookie_worker.finished.connect(self.on_cookie_verification_finished)
-        self.cookie_worker.start()
+        self.cancel_verify_btn.show()
+        if not self._verify_thread.isRunning():
+            self._verify_thread.start()
+        self.verify_requested.emit(cookie_file, browser_source, test_url)
 
     @Slot(bool, str)
     def on_cookie_verification_finished(self, success, message):
-        if hasattr(self, 'active_verify_btn'):
-            self.active_verify_btn.setEnabled(True)
-            self.active_verify_btn.setText(self.active_verify_btn_text)
+        if not self._pending_verify_btns:
+            return
+        key, original_text = self._pending_verify_btns.popleft()
+        btn_widget = self.verify_buttons[key]
+        btn_widget.setEnabled(True)
+        btn_widget.setText(original_text)
+        if not self._pending_verify_btns:
+            self.cancel_verify_btn.hide()
+            self.cancel_verify_btn.setEnabled(True)
+            self._verify_worker.reset_cancel()
+
+        if message == VERIFY_CANCELLED_MSG:
+            self._show_verify_status(key, None, message)
+        else:
+            self._show_verify_status(key, success, message)
 
-        if success:
-            QMessageBox.information(self, "Verification Success", message)
+    def _show_verify_status(self, key, success, message):
+        """Shows a verification result next to the platform's Verify button (success=None is neutral)."""
+        label = self.verify_status_labels[key]
+        if success is None:
+            state, text = "", message
+        else:
+            state, text = ("ok", f"✓ {message}") if success else ("error", f"✗ {message}")
+        label.setProperty("state", state)
+        # Dynamic property selectors only re-apply after a re-polish
+        label.style().unpolish(label)
+        label.style().polish(label)
+        label.setText(text)
+        label.setToolTip(message)
+        if text:
+            self._verify_status_timers[key].start()
         else:
-            QMessageBox.critical(self, "Verification Failed", message)
+            self._verify_status_timers[key].stop()
+
+    @Slot()
+    def cancel_verification(self):
+        """Cancels pending cookie verifications; the running one stops before any browser launch."""
+        self.cancel_verify_btn.setEnabled(False)
+        self._verify_worker.cancel()
+
+    @Slot()
+    def stop_verify_thread(self):
+        """Stops the cookie verification thread, cancelling (and killing) any running probe."""
+        if self._verify_thread.isRunning():
+            self._verify_worker.cancel()
+            self._verify_thread.quit()
+            self._verify_thread.wait()
 
     def get_settings(self):
         """Returns the current global settings as a dictionary."""
-        return {
-            'video': {
-                'enabled': self.enable_video_chk.isChecked(),
-                'top': self.top_video_chk.isChecked(),
-                'count': self.top_video_count.value(),
-                'all': self.all_video_chk.isChecked(),
-                'resolution': self.video_res_combo.currentText()
-            },
-            'photo': {
-                'enabled': self.enable_photo_chk.isChecked(),
-                'top': self.top_photo_chk.isChecked(),
-                'count': self.top_photo_count.value(),
-                'all': self.all_photo_chk.isChecked(),
-                'quality': self.photo_res_combo.currentText()
-            }
-        }
+        settings = {}
+        for (section, key), getter, _setter, _default in self._settings_schema:
+            settings.setdefault(section, {})[key] = getter()
+        return settings
 
     def set_settings(self, settings):
         """Updates the UI elements with the provided settings."""
-        # Video Settings
-        video_settings = settings.get('video', {})
-        self.enable_video_chk.setChecked(video_settings.get('enabled', False))
-        self.top_video_chk.setChecked(video_settings.get('top', False))
-        self.top_video_count.setValue(video_settings.get('count', 5))
-        self.all_video_chk.setChecked(video_settings.get('all', False))
-        
-        res_text = video_settings.get('resolution', "Best Available")
-        index = self.video_res_combo.findText(res_text)
-        if index >= 0:
-            self.video_res_combo.setCurrentIndex(index)
-
-        # Photo Settings
-        photo_settings = settings.get('photo', {})
-        self.enable_photo_chk.setChecked(photo_settings.get('enabled', False))
-        self.top_photo_chk.setChecked(photo_settings.get('top', False))
-        self.top_photo_count.setValue(photo_settings.get('count', 5))
-        self.all_photo_chk.setChecked(photo_settings.get('all', False))
-        
-        qual_text = photo_settings.get('quality', "Best Available")
-        index = self.photo_res_combo.findText(qual_text)
-        if index >= 0:
-            self.photo_res_combo.setCurrentIndex(index)
-
-        # Load Credentials
-        fb_creds = self.credentials_manager.get_credential('facebook')
-        if fb_creds:
-            self.fb_cookies_path.setText(fb_creds.get('cookie_file', ''))
-            self._set_combo_text(self.fb_browser_combo, fb_creds.get('browser', 'None'))
-
-        pin_creds = self.credentials_manager.get_credential('pinterest')
-        if pin_creds:
-            self.pin_cookies_path.setText(pin_creds.get('cookie_file', ''))
-            self._set_combo_text(self.pin_browser_combo, pin_creds.get('browser', 'None'))
-
-        tt_creds = self.credentials_manager.get_credential('tiktok')
-        if tt_creds:
-            self.tt_cookies_path.setText(tt_creds.get('cookie_file', ''))
-            self._set_combo_text(self.tt_browser_combo, tt_creds.get('browser', 'None'))
-
-        yt_creds = self.credentials_manager.get_credential('youtube')
-        if yt_creds:
-            self.yt_cookies_path.setText(yt_creds.get('cookie_file', ''))
-            self._set_combo_text(self.yt_browser_combo, yt_creds.get('browser', 'None'))
-
-        ig_creds = self.credentials_manager.get_credential('instagram')
-        if ig_creds:
-            self.ig_cookies_path.setText(ig_creds.get('cookie_file', ''))
-            self._set_combo_text(self.ig_browser_combo, ig_creds.get('browser', 'None'))
+        for (section, key), _getter, setter, default in self._settings_schema:
+            setter(settings.get(section, {}).get(key, default))
+
+        # Load Credentials (tabs not built yet pick theirs up when materialized)
+        self._saved_credentials = self.credentials_manager.get_all()
+        for key in self.cookie_path_inputs:
+            self._apply_saved_credentials(key)
+
+    def _apply_saved_credentials(self, key):
+        creds = self._saved_credentials.get(key)
+        if creds:
+            self.cookie_path_inputs[key].setText(creds.get('cookie_file', ''))
+            self._set_combo_text(self.browser_combos[key], creds.get('browser', 'None'))
 
     def _set_combo_text(self, combo, text):
-        idx = combo.findText(text)
+        # Index maps are per model, so the shared browser model is mapped once
+        index_map = self._combo_index_maps.get(combo.model())
+        if index_map is None:
+            index_map = {combo.itemText(i): i for i in range(combo.count())}
+            self._combo_index_maps[combo.model()] = index_map
+        idx = index_map.get(text, -1)
         if idx >= 0:
             combo.setCurrentIndex(idx)
 
@@ -895,42 +895,29 @@ class SettingsTab(QWidget):
         self.set_settings(settings)
 
     def save_current_settings(self):
-        """Saves the current UI state to disk."""
-        # Save General Settings
+        """Snapshots the current UI state and saves it to disk in the background."""
         settings = self.get_settings()
-        success = save_settings(settings)
-        
-        # Save Credentials
-        fb_data = {
-            'cookie_file': self.fb_cookies_path.text(),
-            'browser': self.fb_browser_combo.currentText()
-        }
-        self.credentials_manager.set_credential('facebook', fb_data)
-
-        pin_data = {
-            'cookie_file': self.pin_cookies_path.text(),
-            'browser': self.pin_browser_combo.currentText()
-        }
-        self.credentials_manager.set_credential('pinterest', pin_data)
-
-        tt_data = {
-            'cookie_file': self.tt_cookies_path.text(),
-            'browser': self.tt_browser_combo.currentText()
+        # Tabs that were never opened were never edited; their stored credentials stay as is
+        credentials = {
+            key: {
+                'cookie_file': cookies_path.text(),
+                'browser': self.browser_combos[key].currentText()
+            }
+            for key, cookies_path in self.cookie_path_inputs.items()
         }
-        self.credentials_manager.set_credential('tiktok', tt_data)
 
-        yt_data = {
-            'cookie_file': self.yt_cookies_path.text(),
-            'browser': self.yt_browser_combo.currentText()
-        }
-        self.credentials_manager.set_credential('youtube', yt_data)
+        self.save_btn.setEnabled(False)
+        worker = SaveSettingsWorker(settings, credentials, self.credentials_manager)
+        worker.signals.finished.connect(self.on_save_finished)
+        self._save_pool.start(worker)
 
-        ig_data = {
-            'cookie_file': self.ig_cookies_path.text(),
-            'browser': self.ig_browser_combo.currentText()
-        }
-        self.credentials_manager.set_credential('instagram', ig_data)
+    def wait_for_pending_saves(self):
+        """Blocks until background saves have been written (used on app close)."""
+        self._save_pool.waitForDone()
 
+    @Slot(bool)
+    def on_save_finished(self, success):
+        self.save_btn.setEnabled(True)
         if success:
             QMessageBox.information(self, "Success", "Settings and Credentials saved successfully!")
         else:
@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QStyle
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QStyle
 )
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QTimer
 from PySide6.QtGui import QMouseEvent
 
 class CustomDialogBase(QDialog):
@@ -9,19 +9,22 @@ class CustomDialogBase(QDialog):
     A base class for dialogs with a custom dark-themed, draggable title bar.
     Subclasses should add their content to self.content_layout.
     """
+    _close_icon = None # Shared by every dialog; built on first use
+
     def __init__(self, title="", parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #18181B; 
-                border: 1px solid #3F3F46;
-                border-radius: 8px;
-            }
-            QLabel { color: #F4F4F5; }
-        """)
+        # Styled by the QDialog#CustomDialog rules in styles.qss
+        self.setObjectName("CustomDialog")
         
-        self.old_pos = None
+        self._drag_offset = None # Cursor position relative to the window while dragging
+
+        # Drag moves are coalesced to at most one per frame (~60 Hz)
+        self._pending_move = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_move)
 
         # --- Main Layout ---
         self.main_layout = QVBoxLayout(self)
@@ -31,65 +34,65 @@ class CustomDialogBase(QDialog):
         # --- Custom Title Bar ---
         self.title_bar = QFrame()
         self.title_bar.setFixedHeight(32)
-        self.title_bar.setStyleSheet("""
-            QFrame {
-                background-color: #27272A;
-                border-bottom: 1px solid #3F3F46;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }
-        """)
+        self.title_bar.setObjectName("CustomDialogTitleBar")
         title_layout = QHBoxLayout(self.title_bar)
         title_layout.setContentsMargins(10, 0, 5, 0)
         
         # Title Label
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("font-weight: bold; font-size: 10pt; border: none; background: transparent;")
+        self.title_label.setObjectName("CustomDialogTitle")
         title_layout.addWidget(self.title_label)
         
         title_layout.addStretch()
         
         # Close Button
         self.close_btn = QPushButton()
-        self.close_btn.setIcon(self.style().standardIcon(QStyle.SP_TitleBarCloseButton))
+        self.close_btn.setIcon(self._title_close_icon())
         self.close_btn.setFixedSize(24, 24)
         self.close_btn.setCursor(Qt.PointingHandCursor)
         self.close_btn.clicked.connect(self.reject)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #EF4444;
-            }
-        """)
+        self.close_btn.setObjectName("CustomDialogCloseButton")
         title_layout.addWidget(self.close_btn)
         
         self.main_layout.addWidget(self.title_bar)
 
         # --- Content Area ---
         content_widget = QFrame()
-        content_widget.setStyleSheet("background-color: #18181B; border: none; border-bottom-left-radius: 8px; border-bottom-right-radius: 8px;")
+        content_widget.setObjectName("CustomDialogContent")
         self.content_layout = QVBoxLayout(content_widget)
         self.content_layout.setSpacing(10)
         self.content_layout.setContentsMargins(15, 15, 15, 15)
         
         self.main_layout.addWidget(content_widget)
 
+    @classmethod
+    def _title_close_icon(cls):
+        """Returns the close icon, asking the style for it only once per process."""
+        if cls._close_icon is None:
+            cls._close_icon = QApplication.style().standardIcon(QStyle.SP_TitleBarCloseButton)
+        return cls._close_icon
+
     # --- Window Dragging Logic ---
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
             # Check if clicked on title bar area (approximate height)
             if event.pos().y() <= 32:
-                self.old_pos = event.globalPos()
+                self._drag_offset = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
 
     def mouseMoveEvent(self, event: QMouseEvent):
-        if self.old_pos:
-            delta = event.globalPos() - self.old_pos
-            self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.old_pos = event.globalPos()
+        if self._drag_offset is not None:
+            self._pending_move = event.globalPosition().toPoint() - self._drag_offset
+            if (self._pending_move - self.pos()).manhattanLength() < 2:
+                return # 1px jitter; the final position is still applied on release
+            if not self._move_timer.isActive():
+                self._move_timer.start()
 
     def mouseReleaseEvent(self, event: QMouseEvent):
-        self.old_pos = None
+        self._drag_offset = None
+        self._move_timer.stop()
+        self._apply_pending_move()
+
+    def _apply_pending_move(self):
+        if self._pending_move is not None:
+            self.move(self._pending_move)
+            self._pending_move = None
@@ -1,6 +1,10 @@
 from PySide6.QtWidgets import QLabel
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRect, QPoint
-from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property, QRect, QRectF, QPoint
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPen
+
+# Circle background colors
+_CIRCLE_BG = QColor("#383838")
+_CIRCLE_BORDER = QColor("#555555")
 
 class SocialIcon(QLabel):
     def __init__(self, image_path, tooltip, size=24, parent=None):
@@ -15,27 +19,42 @@ class SocialIcon(QLabel):
             self.setText("?")
         
         self._scale = 1.0
+        self._scaled_pixmaps = {} # (side, device pixel ratio) -> pre-scaled pixmap
         
         # Setup Animation
         self._animation = QPropertyAnimation(self, b"iconScale", self)
         self._animation.setDuration(150) # ms
         self._animation.setEasingCurve(QEasingCurve.OutQuad)
 
-        # Base Stylesheet for the circle background
-        self.setStyleSheet(
-            f"border-radius: {size//2}px; " 
-            "background-color: #383838; "
-            "border: 1px solid #555555;"
-        )
-
     @Property(float)
     def iconScale(self):
         return self._scale
 
     @iconScale.setter
     def iconScale(self, value):
+        old_rect = self._image_rect()
         self._scale = value
-        self.update() # Trigger repaint
+        # The image is drawn at whole-pixel sizes, so most animation ticks
+        # change nothing on screen; only repaint when the target rect moves.
+        if self._image_rect() != old_rect:
+            self.update()
+
+    def _image_rect(self):
+        """Returns the centered rect the icon image is drawn into at the current scale."""
+        w = self.width()
+        h = self.height()
+        
+        # Target size for the image inside the circle
+        # 60% of the widget size gives a nice padding while keeping it large enough
+        base_img_size = w * 0.60 
+        
+        current_img_size = base_img_size * self._scale
+        
+        # Center it: (Container - Content) / 2
+        offset_x = (w - current_img_size) / 2
+        offset_y = (h - current_img_size) / 2
+        
+        return QRect(int(offset_x), int(offset_y), int(current_img_size), int(current_img_size))
 
     def enterEvent(self, event):
         self._animation.stop()
@@ -52,39 +71,40 @@ class SocialIcon(QLabel):
         super().leaveEvent(event)
 
     def paintEvent(self, event):
-        # Let the stylesheet draw the background/border first (handled by base QLabel paint if we don't override completely?)
-        # Actually, standard QLabel paint might draw text if pixmap isn't set via setPixmap.
-        # Since we are doing custom painting for the zoom, we should call standard paint for the background 
-        # (via stylesheet) then draw our scaled image on top.
-        
-        # To let stylesheet background render, we can call standard paint, 
-        # BUT standard paint attempts to draw content (text/pixmap).
-        # Since we didn't setPixmap() on the label itself (we stored it in _original_pixmap),
-        # calling super().paintEvent(event) will just draw the background styled by CSS.
-        super().paintEvent(event)
-
-        if self._original_pixmap.isNull():
-            return
-
+        # Everything (circle background, border, image or "?" fallback) is drawn
+        # with this one painter instead of a QLabel/stylesheet pass plus a second painter.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        # Calculate Scaled Size
-        w = self.width()
-        h = self.height()
-        
-        # Target size for the image inside the circle
-        # 60% of the widget size gives a nice padding while keeping it large enough
-        base_img_size = w * 0.60 
-        
-        current_img_size = base_img_size * self._scale
-        
-        # Center it: (Container - Content) / 2
-        offset_x = (w - current_img_size) / 2
-        offset_y = (h - current_img_size) / 2
-        
-        target_rect = QRect(int(offset_x), int(offset_y), int(current_img_size), int(current_img_size))
-        
-        painter.drawPixmap(target_rect, self._original_pixmap)
+        # Circle background with a 1px border, inset half a pixel to stay crisp
+        radius = self.width() / 2 - 0.5
+        painter.setPen(QPen(_CIRCLE_BORDER, 1))
+        painter.setBrush(_CIRCLE_BG)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+
+        if self._original_pixmap.isNull():
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            painter.drawText(self.rect(), Qt.AlignCenter, self.text())
+        else:
+            target_rect = self._image_rect()
+            # The pixmap already matches the target size, so this is a plain blit
+            painter.drawPixmap(target_rect.topLeft(), self._scaled_pixmap(target_rect.width()))
         painter.end()
+
+    def _scaled_pixmap(self, side):
+        """
+        Returns the icon image smoothly scaled to side x side (in device pixels
+        for HiDPI screens). The hover zoom only goes through a handful of sizes,
+        so each is resampled once instead of on every animation frame.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (side, dpr)
+        pixmap = self._scaled_pixmaps.get(key)
+        if pixmap is None:
+            device_side = round(side * dpr)
+            pixmap = self._original_pixmap.scaled(
+                device_side, device_side, Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            self._scaled_pixmaps[key] = pixmap
+        return pixmap
@@ -1,9 +1,24 @@
+import functools
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QAbstractButton
-from PySide6.QtCore import Qt, QSize, QPoint
+from PySide6.QtCore import Qt, QSize, QPoint, QTimer
 from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap
 from app.helpers import resource_path
 from app.config.version import VERSION
 
+# Title bar colours. styles.qss cannot import these, so its QWidget#TitleBar
+# rule points back here; change both together.
+TITLE_BAR_BACKGROUND = "#1C1C21"
+TITLE_BAR_BORDER = "#27272A"
+
+@functools.lru_cache(maxsize=8)
+def _load_logo(size):
+    """Returns the app logo scaled to size x size, loaded from disk only once per size."""
+    logo_pixmap = QPixmap(resource_path("app/resources/images/logo.png"))
+    if logo_pixmap.isNull():
+        return logo_pixmap
+    return logo_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
 class CaptionButton(QAbstractButton):
     """
     A custom button for window controls (Minimize, Maximize, Close)
@@ -14,6 +29,10 @@ class CaptionButton(QAbstractButton):
     TypeClose = 2
     TypeRestore = 3
 
+    StateNormal = 0
+    StateHover = 1
+    StatePressed = 2
+
     def __init__(self, btn_type, parent=None):
         super().__init__(parent)
         self._type = btn_type
@@ -27,57 +46,145 @@ class CaptionButton(QAbstractButton):
         self._close_hover_bg = QColor("#E81123")
         self._close_pressed_bg = QColor("#B71C1C")
         self._close_icon_color = QColor("#FFFFFF")
+        # Idle background, drawn to match the title bar behind the button
+        self._idle_bg = QColor(TITLE_BAR_BACKGROUND)
+        self._idle_border = QColor(TITLE_BAR_BORDER)
+
+        # Pens and icon center are fixed (the size is fixed), so build them once
+        self._icon_pen = QPen(self._icon_color)
+        self._icon_pen.setWidth(1)
+        self._close_icon_pen = QPen(self._close_icon_color)
+        self._close_icon_pen.setWidth(1)
+        self._center = (self.width() // 2, self.height() // 2)
 
         if self._type == self.TypeClose:
             self.setObjectName("CaptionCloseButton")
+        else:
+            # Every pixel is painted below (idle state included), so Qt can skip
+            # drawing the title bar behind the button. The close button stays
+            # transparent because it sits on the window's rounded corner.
+            self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+            self.setAutoFillBackground(False)
+
+        self._state = self.StateNormal
+        self._state_pixmaps = {} # (type, state, device pixel ratio) -> pre-rendered button
 
     def set_type(self, btn_type):
+        # Renders are cached per type, so toggling maximize/restore only swaps pixmaps
         self._type = btn_type
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Draw Background
-        if self.isDown():
-            bg_color = self._close_pressed_bg if self._type == self.TypeClose else self._pressed_bg
-            painter.fillRect(self.rect(), bg_color)
-        elif self.underMouse():
-            bg_color = self._close_hover_bg if self._type == self.TypeClose else self._hover_bg
-            painter.fillRect(self.rect(), bg_color)
-
-        # Draw Icon
-        icon_color = self._icon_color
-        if self._type == self.TypeClose and (self.underMouse() or self.isDown()):
-            icon_color = self._close_icon_color
-        
-        pen = QPen(icon_color)
-        pen.setWidth(1)
-        painter.setPen(pen)
-
-        center_x = self.width() // 2
-        center_y = self.height() // 2
+    def _build_icon_shapes(self):
+        """
+        Returns the icon for the current type as (QPainter method name, args) pairs.
+        The button has a fixed size, so the geometry only changes with the type.
+        """
+        center_x, center_y = self._center
 
         if self._type == self.TypeMinimize:
             # Draw horizontal line
-            painter.drawLine(center_x - 5, center_y, center_x + 5, center_y)
+            return [('drawLine', (center_x - 5, center_y, center_x + 5, center_y))]
         
         elif self._type == self.TypeMaximize:
             # Draw box
-            painter.drawRect(center_x - 5, center_y - 5, 10, 10)
+            return [('drawRect', (center_x - 5, center_y - 5, 10, 10))]
         
         elif self._type == self.TypeRestore:
             # Draw two overlapping boxes
-            painter.drawRect(center_x - 3, center_y - 3, 8, 8) # Front
-            # Back box (top-right lines)
-            painter.drawLine(center_x + 1, center_y - 5, center_x + 5, center_y - 5) # Top
-            painter.drawLine(center_x + 5, center_y - 5, center_x + 5, center_y + 1) # Right
+            return [
+                ('drawRect', (center_x - 3, center_y - 3, 8, 8)), # Front
+                # Back box (top-right lines)
+                ('drawLine', (center_x + 1, center_y - 5, center_x + 5, center_y - 5)), # Top
+                ('drawLine', (center_x + 5, center_y - 5, center_x + 5, center_y + 1)), # Right
+            ]
         
         elif self._type == self.TypeClose:
             # Draw X
-            painter.drawLine(center_x - 5, center_y - 5, center_x + 5, center_y + 5)
-            painter.drawLine(center_x + 5, center_y - 5, center_x - 5, center_y + 5)
+            return [
+                ('drawLine', (center_x - 5, center_y - 5, center_x + 5, center_y + 5)),
+                ('drawLine', (center_x + 5, center_y - 5, center_x - 5, center_y + 5)),
+            ]
+
+        return []
+
+    def _current_state(self):
+        if self.isDown():
+            return self.StatePressed
+        if self.underMouse():
+            return self.StateHover
+        return self.StateNormal
+
+    def _sync_state(self):
+        """Schedules a repaint only when the visual state actually changes."""
+        state = self._current_state()
+        if state != self._state:
+            self._state = state
+            self.update()
+
+    def enterEvent(self, event):
+        super().enterEvent(event)
+        self._sync_state()
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._sync_state()
+
+    def mousePressEvent(self, event):
+        super().mousePressEvent(event)
+        self._sync_state()
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        self._sync_state()
+
+    def paintEvent(self, event):
+        # Painting can also be triggered by Qt (e.g. setDown), so refresh the state here
+        self._state = state = self._current_state()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._state_pixmap(state))
+        painter.end()
+
+    def _state_pixmap(self, state):
+        """
+        Returns the button rendered in the given state. Each state is painted
+        once per type and device pixel ratio; later paints are a single blit.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (self._type, state, dpr)
+        pixmap = self._state_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            self._render(painter, state)
+            painter.end()
+            self._state_pixmaps[key] = pixmap
+        return pixmap
+
+    def _render(self, painter, state):
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Draw Background
+        if state == self.StatePressed:
+            bg_color = self._close_pressed_bg if self._type == self.TypeClose else self._pressed_bg
+            painter.fillRect(self.rect(), bg_color)
+        elif state == self.StateHover:
+            bg_color = self._close_hover_bg if self._type == self.TypeClose else self._hover_bg
+            painter.fillRect(self.rect(), bg_color)
+        elif self._type != self.TypeClose:
+            painter.fillRect(self.rect(), self._idle_bg)
+            painter.fillRect(0, self.height() - 1, self.width(), 1, self._idle_border) # Title bar bottom border
+
+        # Draw Icon
+        if self._type == self.TypeClose and state != self.StateNormal:
+            painter.setPen(self._close_icon_pen)
+        else:
+            painter.setPen(self._icon_pen)
+
+        for method, args in self._build_icon_shapes():
+            getattr(painter, method)(*args)
 
 
 class TitleBar(QWidget):
@@ -94,9 +201,9 @@ class TitleBar(QWidget):
         # Logo
         self.logo_icon = QLabel()
         self.logo_icon.setFixedSize(20, 20)
-        logo_pixmap = QPixmap(resource_path("app/resources/images/logo.png"))
+        logo_pixmap = _load_logo(20)
         if not logo_pixmap.isNull():
-            self.logo_icon.setPixmap(logo_pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self.logo_icon.setPixmap(logo_pixmap)
         layout.addWidget(self.logo_icon)
 
         # Title
@@ -120,7 +227,14 @@ class TitleBar(QWidget):
         layout.addWidget(self.btn_close)
 
         self._parent = parent
-        self._start_pos = None
+        self._drag_offset = None # Cursor position relative to the window while dragging
+
+        # Window drags are coalesced to at most one move per frame (~60 Hz)
+        self._pending_move = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_move)
         
     def minimize_window(self):
         if self.window().isMinimized():
@@ -142,13 +256,22 @@ class TitleBar(QWidget):
     # Mouse events for dragging
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self._start_pos = event.globalPosition().toPoint()
+            self._drag_offset = event.globalPosition().toPoint() - self.window().frameGeometry().topLeft()
 
     def mouseMoveEvent(self, event):
-        if self._start_pos:
-            delta = event.globalPosition().toPoint() - self._start_pos
-            self.window().move(self.window().pos() + delta)
-            self._start_pos = event.globalPosition().toPoint()
+        if self._drag_offset is not None:
+            self._pending_move = event.globalPosition().toPoint() - self._drag_offset
+            if (self._pending_move - self.window().pos()).manhattanLength() < 2:
+                return # 1px jitter; the final position is still applied on release
+            if not self._move_timer.isActive():
+                self._move_timer.start()
 
     def mouseReleaseEvent(self, event):
-        self._start_pos = None
\ No newline at end of file
+        self._drag_offset = None
+        self._move_timer.stop()
+        self._apply_pending_move()
+
+    def _apply_pending_move(self):
+        if self._pending_move is not None:
+            self.window().move(self._pending_move)
+            self._pending_move = None
\ No newline at end of file
@@ -1,7 +1,11 @@
 import os
+import json
 import shutil
-import sys
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+MANIFEST_NAME = '.manifest.json'
 
 def get_playwright_browsers_path():
     # Try getting path from playwright command
@@ -18,6 +22,67 @@ def get_playwright_browsers_path():
         print(f"Error determining path: {e}")
         return None
 
+def build_manifest(root):
+    """Lists every file under root as {relative path: [size, mtime_ns]}."""
+    manifest = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            full_path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(full_path, root)
+            if rel_path == MANIFEST_NAME:
+                continue
+            st = os.stat(full_path)
+            manifest[rel_path.replace(os.sep, '/')] = [st.st_size, st.st_mtime_ns]
+    return manifest
+
+def read_manifest(dest_path):
+    """Returns the manifest written by the last copy, or None if there is none."""
+    try:
+        with open(os.path.join(dest_path, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def copy_tree_parallel(source_path, dest_path):
+    """
+    Copies source_path to dest_path like shutil.copytree, but overlaps the
+    per-file copies on a thread pool (the browser folders hold tens of
+    thousands of small files, so the copy is syscall-bound).
+    """
+    jobs = []
+    for dirpath, _, filenames in os.walk(source_path, followlinks=True):
+        target_dir = os.path.join(dest_path, os.path.relpath(dirpath, source_path))
+        os.makedirs(target_dir, exist_ok=True)
+        for name in filenames:
+            jobs.append((os.path.join(dirpath, name), os.path.join(target_dir, name)))
+
+    # shutil.copy keeps the permission bits, so browser executables stay runnable
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for future in [executor.submit(shutil.copy, src, dst) for src, dst in jobs]:
+            future.result() # Re-raise the first copy error, if any
+
+def copy_tree_native(source_path, dest_path):
+    """
+    Copies with the OS's own multithreaded/bulk copier (robocopy on Windows,
+    rsync elsewhere). Returns False when neither is available or the copy fails.
+    """
+    if sys.platform == 'win32':
+        if not shutil.which('robocopy'):
+            return False
+        result = subprocess.run(
+            ['robocopy', source_path, dest_path, '/MIR', '/MT:16', '/NFL', '/NDL', '/NJH', '/NJS'],
+            check=False
+        )
+        return result.returncode < 8 # robocopy: 0-7 mean success, 8+ mean failure
+
+    if not shutil.which('rsync'):
+        return False
+    result = subprocess.run(
+        ['rsync', '-a', '--delete', source_path.rstrip(os.sep) + os.sep, dest_path.rstrip(os.sep) + os.sep],
+        check=False
+    )
+    return result.returncode == 0
+
 def copy_browsers():
     source_path = get_playwright_browsers_path()
     dest_path = os.path.join(os.getcwd(), 'playwright-browsers')
@@ -30,13 +95,26 @@ def copy_browsers():
     print(f"Found browsers at: {source_path}")
     print(f"Copying to: {dest_path} ...")
     
+    manifest = build_manifest(source_path)
+
     if os.path.exists(dest_path):
-        print("Destination folder already exists. Skipping copy to avoid overwriting.")
-        print("Delete 'playwright-browsers' folder if you want to refresh it.")
-        return
+        previous = read_manifest(dest_path)
+        if previous is None:
+            # Not created by this script (or by an older version of it); leave it alone
+            print("Destination folder already exists. Skipping copy to avoid overwriting.")
+            print("Delete 'playwright-browsers' folder if you want to refresh it.")
+            return
+        if previous == manifest:
+            print("Browsers are already up to date. Skipping copy.")
+            return
+        print("Installed browsers changed since the last copy. Refreshing...")
+        shutil.rmtree(dest_path)
 
     try:
-        shutil.copytree(source_path, dest_path)
+        if not copy_tree_native(source_path, dest_path):
+            copy_tree_parallel(source_path, dest_path)
+        with open(os.path.join(dest_path, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f)
         print("Success! Browsers copied.")
         print("Now, when you build/distribute your app, include this 'playwright-browsers' folder")
         print("alongside your executable (or inside the _internal folder).")
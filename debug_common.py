@@ -0,0 +1,111 @@
+"""
+Shared Playwright setup for the debug scripts.
+
+One Chromium process is started on first use and kept for the rest of the
+interpreter's life; each get_page() call only creates (and closes) its own
+BrowserContext, so cookies and storage stay isolated per call.
+"""
+import atexit
+import contextlib
+from urllib.parse import urlparse
+
+# Smaller than Playwright's 1280x720 default: less layout and paint per page,
+# and nothing here needs more. Callers can still pass their own viewport.
+DEFAULT_VIEWPORT = {"width": 800, "height": 600}
+
+_playwright = None
+_browser = None
+
+def _context_options(context_opts):
+    return {"viewport": DEFAULT_VIEWPORT, **(context_opts or {})}
+
+def _shutdown():
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+def get_browser():
+    """Returns the shared headless Chromium, launching it on first use."""
+    global _playwright, _browser
+    if _browser is None:
+        from playwright.sync_api import sync_playwright
+
+        print("Launching browser...")
+        _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(headless=True, args=["--disable-dev-shm-usage"])
+        atexit.register(_shutdown)
+    return _browser
+
+@contextlib.contextmanager
+def get_page(context_opts=None, cookies=None, block_resource_types=()):
+    """
+    Yields a page in a fresh context of the shared browser.
+    context_opts are passed to new_context; cookies, if given, are added to it.
+    Requests whose resource type is in block_resource_types (e.g. "image") are aborted.
+    """
+    context = get_browser().new_context(**_context_options(context_opts))
+    if block_resource_types:
+        blocked = frozenset(block_resource_types)
+        context.route(
+            "**/*",
+            lambda route: route.abort() if route.request.resource_type in blocked else route.continue_()
+        )
+    try:
+        if cookies:
+            try:
+                context.add_cookies(cookies)
+                print("Cookies added to context.")
+            except Exception as e:
+                print(f"Failed to add cookies: {e}")
+        yield context.new_page()
+    finally:
+        context.close()
+
+@contextlib.asynccontextmanager
+async def async_context(context_opts=None, block_resource_types=()):
+    """
+    Async counterpart of get_page() for scripts that scrape several pages at once.
+    Launches its own headless Chromium (the sync one above can't be shared with
+    an event loop) and yields a single context; callers open one page per task.
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        print("Launching browser...")
+        browser = await p.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context(**_context_options(context_opts))
+            if block_resource_types:
+                blocked = frozenset(block_resource_types)
+                async def _filter(route):
+                    if route.request.resource_type in blocked:
+                        await route.abort()
+                    else:
+                        await route.continue_()
+                await context.route("**/*", _filter)
+            yield context
+        finally:
+            await browser.close()
+
+async def smart_goto(page, url, timeout=60000):
+    """
+    Navigates page to url, skipping work a real goto() would repeat.
+    Returns "skip" if the page is already there, "push" if it was routed
+    in-page (same host: history.pushState plus a popstate so the SPA router
+    renders the new route), or "goto" after a full navigation.
+    """
+    current = page.url
+    if current == url:
+        return "skip"
+    if urlparse(current).netloc == urlparse(url).netloc:
+        await page.evaluate(
+            "u => { history.pushState({}, '', u); window.dispatchEvent(new PopStateEvent('popstate')); }",
+            url
+        )
+        return "push"
+    await page.goto(url, timeout=timeout, wait_until="commit")
+    return "goto"
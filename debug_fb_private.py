@@ -1,7 +1,5 @@
 
 import asyncio
-from app.platform_handler import PlatformHandlerFactory, download_with_ytdlp
-from app.config.credentials import CredentialsManager
 import logging
 import os
 
@@ -23,7 +21,10 @@ async def main():
         os.makedirs(DOWNLOAD_PATH)
         log.info(f"Created download directory: {DOWNLOAD_PATH}")
 
-    # 1. Initialize handlers and managers
+    # 1. Initialize handlers and managers (imported here; platform_handler pulls in Playwright)
+    from app.platform_handler import PlatformHandlerFactory, download_with_ytdlp
+    from app.config.credentials import CredentialsManager
+
     handler_factory = PlatformHandlerFactory()
     creds_manager = CredentialsManager()
     
@@ -61,33 +62,49 @@ async def main():
         log.error(f"An error occurred during scraping: {e}", exc_info=True)
         return
         
-    # 5. Attempt to download each video
-    for i, metadata in enumerate(video_metadata_list):
+    # 5. Download the videos, a few at a time (yt-dlp downloads are I/O bound)
+    total = len(video_metadata_list)
+    semaphore = asyncio.Semaphore(4)
+    progress_by_index = {}
+
+    # Prepare settings for the download
+    download_settings = {
+        'video_path': DOWNLOAD_PATH,
+        'cookie_file': scrape_settings['cookie_file'] # Pass the same cookie file
+    }
+
+    def update_progress(i, p):
+        # Runs on the event loop thread only, so progress_by_index is never
+        # read and written by two threads at once.
+        # One status line for all running downloads instead of interleaved \r output
+        progress_by_index[i] = p
+        line = "  ".join(f"[{n+1}] {pct}%" for n, pct in sorted(progress_by_index.items()))
+        print(f"Progress: {line}", end='\r')
+
+    async def download_one(i, metadata):
         video_url = metadata.get('url')
-        log.info(f"--- ATTEMPTING DOWNLOAD [{i+1}/{len(video_metadata_list)}]: {video_url} ---")
-        
-        # Prepare settings for the download
-        download_settings = {
-            'video_path': DOWNLOAD_PATH,
-            'cookie_file': scrape_settings['cookie_file'] # Pass the same cookie file
-        }
-        
-        # Simple progress callback for console
-        def progress(p):
-            print(f"Progress: {p}%", end='\r')
-
-        try:
-            success = await loop.run_in_executor(
-                None, download_with_ytdlp, video_url, DOWNLOAD_PATH, progress, download_settings
-            )
-            if success:
-                log.info(f"SUCCESS: Download completed for {video_url}")
-            else:
-                log.error(f"FAILED: Download function returned False for {video_url}")
-        except Exception as e:
-            log.error(f"CRITICAL FAILURE: An exception occurred while trying to download {video_url}", exc_info=True)
-        
-        print("\n") # Newline after progress bar
+        async with semaphore:
+            log.info(f"--- ATTEMPTING DOWNLOAD [{i+1}/{total}]: {video_url} ---")
+
+            def progress(p):
+                # Called from yt-dlp's executor thread; hand the update to the loop
+                loop.call_soon_threadsafe(update_progress, i, p)
+
+            try:
+                success, status = await loop.run_in_executor(
+                    None, download_with_ytdlp, video_url, DOWNLOAD_PATH, progress, download_settings
+                )
+                if success:
+                    log.info(f"SUCCESS: Download completed for {video_url}")
+                else:
+                    log.error(f"FAILED: Download returned '{status}' for {video_url}")
+            except Exception as e:
+                log.error(f"CRITICAL FAILURE: An exception occurred while trying to download {video_url}", exc_info=True)
+            finally:
+                progress_by_index.pop(i, None)
+
+    await asyncio.gather(*(download_one(i, metadata) for i, metadata in enumerate(video_metadata_list)))
+    print("\n") # Newline after progress line
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,17 +1,23 @@
 import logging
+import logging.handlers
 import sys
 import os
 # Ensure 'app' is in path
 sys.path.append(os.getcwd())
 
-from app.platform_handler import extract_metadata_with_playwright
-
 # Setup logging
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Buffer DEBUG chatter and write it to the file in batches; errors flush immediately.
+# logging's own exit hook flushes whatever is left.
+log_file_handler = logging.FileHandler("debug_fb_scrape.log", mode='w', encoding='utf-8')
+log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler("debug_fb_scrape.log", mode='w', encoding='utf-8'),
+        logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=log_file_handler),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -33,9 +39,13 @@ def run_debug():
     if not os.path.exists(settings["cookie_file"]):
         print(f"WARNING: Cookie file not found at {settings['cookie_file']}")
     
+    # Deferred so the cookie check above runs before Playwright is imported
+    from app.platform_handler import extract_metadata_with_playwright
+    from debug_common import get_browser
+
     # Call the function directly
     try:
-        results = extract_metadata_with_playwright(url, max_entries=50, settings=settings)
+        results = extract_metadata_with_playwright(url, max_entries=50, settings=settings, browser=get_browser())
         
         print(f"\n--- Scrape Results ---")
         print(f"Total Items Found: {len(results)}")
@@ -2,6 +2,7 @@ import hashlib
 import hmac
 import json
 import base64
+import re
 import sys
 import os
 
@@ -14,11 +15,10 @@ from app.config.license_manager import LicenseManager, SECRET_KEY as APP_KEY
 
 def get_key_from_keygen():
     with open("key_gen.py", "r") as f:
-        for line in f:
-            if "SECRET_KEY =" in line:
-                # overly simple parse
-                return line.split("=")[1].strip().strip("b").strip("'").strip('"')
-    return None
+        text = f.read()
+    # One pass over the whole file; handles both b"..." and plain string literals
+    match = re.search(r"^SECRET_KEY\s*=\s*b?(['\"])(.*?)\1", text, re.M)
+    return match.group(2) if match else None
 
 print(f"App Key Bytes: {APP_KEY}")
 print(f"App Key Hash: {hashlib.sha256(APP_KEY).hexdigest()}")
@@ -32,15 +32,16 @@ data = {
 }
 json_str = json.dumps(data)
 b64_payload = base64.b64encode(json_str.encode()).decode()
-signature = hmac.new(APP_KEY, b64_payload.encode(), hashlib.sha256).hexdigest()
+signature = hmac.digest(APP_KEY, b64_payload.encode(), "sha256").hex()
 license_key = f"{b64_payload}.{signature}"
+# Smoke check: the app compares signatures with hmac.compare_digest
+assert hmac.compare_digest(bytes.fromhex(signature), bytes.fromhex(signature))
 
 print(f"Generated Test Key: {license_key}")
 
 # Simulate Verification via Class
-lm = LicenseManager()
-# Force HWID for test
-lm.hwid = hwid 
+# Force HWID for test (also skips the hardware probe)
+lm = LicenseManager(hwid=hwid)
 
 print("Verifying with LicenseManager...")
 is_valid, msg = lm.verify_key(license_key)
@@ -1,83 +1,116 @@
-import os
-import time
-from playwright.sync_api import sync_playwright
+import asyncio
+import sys
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from debug_common import async_context, smart_goto
 
-def debug_pinterest_logic(url):
-    print(f"\n--- DEBUG: PINTEREST SCRAPE LOGIC ---")
-    print(f"Target URL: {url}")
+MAX_CONCURRENCY = 5
+
+# Pin extraction script, built once at import instead of per call.
+# Kept deliberately simpler than the app's extractor for debug purposes.
+# Returns raw, possibly duplicated rows; dedupe_and_sort() orders them.
+_PIN_EXTRACT_JS = """
+() => {
+    const links = Array.from(document.querySelectorAll('a[href]'));
+    return links
+        .filter(a => a.href.includes('pinterest.com/pin/'))
+        .map(a => {
+            const rect = a.getBoundingClientRect();
+            const container = a.closest('[data-test-id="pin"], .pin, .post, article');
+            let isVideo = false;
+            let title = a.innerText || a.getAttribute('aria-label') || "No Title";
+
+            if (container) {
+                if (container.querySelector('video, [aria-label*="video"], .video-icon')) isVideo = true;
+                if (/\\d+\\:\\d+/.test(container.innerText)) isVideo = true;
+            }
 
-    with sync_playwright() as p:
-        print("Launching browser...")
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = context.new_page()
-        
-        print("Navigating to Pinterest...")
+            return {
+                url: a.href.split('?')[0],
+                title: title.split('\\n')[0].substring(0, 30),
+                top: Math.round(rect.top + window.scrollY),
+                left: Math.round(rect.left + window.scrollX),
+                isVideo: isVideo
+            };
+        });
+}
+""".strip()
+
+async def scrape_one(pages, url):
+    """
+    Scrapes one URL in a tab borrowed from the pool and returns its sorted pins
+    (or [] on error). Tabs are reused, so a tab that last showed a Pinterest URL
+    routes in-page instead of reloading.
+    """
+    page = await pages.get()
+    try:
+        print(f"Navigating to {url} ...")
+        # Return as soon as the server responds; the pin wait below covers parsing
+        how = await smart_goto(page, url)
+        if how == "push":
+            # Old pins are still on screen until the router swaps the grid in
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
         try:
-            page.goto(url, timeout=60000, wait_until="domcontentloaded")
-            time.sleep(5)
-            
-            print("Extracting and sorting items...")
-            # Use a simpler, more robust extraction script for debug purposes
-            results = page.evaluate(
-                """
-                () => {
-                    const links = Array.from(document.querySelectorAll('a[href]'));
-                    const data = links
-                        .filter(a => a.href.includes('pinterest.com/pin/'))
-                        .map(a => {
-                            const rect = a.getBoundingClientRect();
-                            const container = a.closest('[data-test-id="pin"], .pin, .post, article');
-                            let isVideo = false;
-                            let title = a.innerText || a.getAttribute('aria-label') || "No Title";
-                            
-                            if (container) {
-                                if (container.querySelector('video, [aria-label*="video"], .video-icon')) isVideo = true;
-                                if (/\\d+\\:\\d+/.test(container.innerText)) isVideo = true;
-                            }
+            await page.wait_for_selector('a[href*="/pin/"]', state="attached", timeout=15000)
+        except PlaywrightTimeoutError:
+            print(f"No pin links appeared within 15s on {url}, scraping what is there.")
+        return dedupe_and_sort(await page.evaluate(_PIN_EXTRACT_JS))
+    except Exception as e:
+        print(f"Error on {url}: {e}")
+        return []
+    finally:
+        pages.put_nowait(page)
+
+ROW_HEIGHT = 150
+
+def dedupe_and_sort(items):
+    """
+    Keeps the first row seen for each pin URL and orders pins by grid row
+    (ROW_HEIGHT-pixel bands), then left to right.
+    """
+    unique = {}
+    for item in items:
+        unique.setdefault(item['url'], item)
+    return sorted(unique.values(), key=lambda d: (d['top'] // ROW_HEIGHT, d['left']))
+
+def print_results(url, results):
+    print(f"\n=== {url} ===")
+    print(f"Found {len(results)} unique pins. First 15 in order:")
+    print(f"{ '#':<3} | { 'Type':<10} | { 'Top':<6} | { 'Left':<6} | { 'Title'}")
+    print("-" * 65)
+
+    for i, item in enumerate(results[:15]):
+        item_type = "VIDEO 🎥" if item['isVideo'] else "PHOTO 🖼️"
+        print(f"{i+1:<3} | {item_type:<10} | {item['top']:<6} | {item['left']:<6} | {item['title']}")
+
+    videos = [r for r in results if r['isVideo']]
+    print(f"\nTotal Videos: {len(videos)}")
+    print(f"Total Photos: {len(results) - len(videos)}")
+
+async def debug_pinterest_logic(urls, max_concurrency=MAX_CONCURRENCY):
+    print(f"\n--- DEBUG: PINTEREST SCRAPE LOGIC ---")
+    print(f"Target URLs: {len(urls)} (up to {max_concurrency} at once)")
 
-                            return {
-                                url: a.href.split('?')[0],
-                                title: title.split('\\n')[0].substring(0, 30),
-                                top: Math.round(rect.top + window.scrollY),
-                                left: Math.round(rect.left + window.scrollX),
-                                isVideo: isVideo
-                            };
-                        });
-                    
-                    // Deduplicate
-                    const unique = {};
-                    data.forEach(d => { if(!unique[d.url]) unique[d.url] = d; });
-                    
-                    // Sort
-                    return Object.values(unique).sort((a, b) => {
-                        const rowDiff = a.top - b.top;
-                        if (Math.abs(rowDiff) > 150) return rowDiff;
-                        return a.left - b.left;
-                    });
-                }
-            """
-            )
-            
-            print(f"\nFound {len(results)} unique pins. First 15 in order:")
-            print(f"{ '#':<3} | { 'Type':<10} | { 'Top':<6} | { 'Left':<6} | { 'Title'}")
-            print("-" * 65)
-            
-            for i, item in enumerate(results[:15]):
-                item_type = "VIDEO 🎥" if item['isVideo'] else "PHOTO 🖼️"
-                print(f"{i+1:<3} | {item_type:<10} | {item['top']:<6} | {item['left']:<6} | {item['title']}")
+    # Images, video and fonts never affect the scrape. Stylesheets and XHR/fetch
+    # stay: the row sort reads layout positions and the pin grid loads over XHR.
+    async with async_context(context_opts={
+        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }, block_resource_types=("image", "media", "font")) as context:
+        # The tab pool doubles as the concurrency limit
+        pages = asyncio.Queue()
+        for _ in range(min(max_concurrency, len(urls))):
+            pages.put_nowait(await context.new_page())
+        print("Extracting and sorting items...")
+        all_results = await asyncio.gather(*(scrape_one(pages, url) for url in urls))
 
-            videos = [r for r in results if r['isVideo']]
-            print(f"\nTotal Videos: {len(videos)}")
-            print(f"Total Photos: {len(results) - len(videos)}")
+    for url, results in zip(urls, all_results):
+        print_results(url, results)
 
-        except Exception as e:
-            print(f"Error: {e}")
-        finally:
-            browser.close()
+async def main():
+    urls = sys.argv[1:] or ["https://www.pinterest.com/search/pins/?q=cooking%20videos"]
+    await debug_pinterest_logic(urls)
 
 if __name__ == "__main__":
-    test_url = "https://www.pinterest.com/search/pins/?q=cooking%20videos"
-    debug_pinterest_logic(test_url)
+    asyncio.run(main())
@@ -6,6 +6,8 @@ from datetime import datetime, timedelta
 
 # Use the exact same byte string logic
 SECRET_KEY = b"super_secret_video_downloader_key_2025_v1"
+# Keyed once; each license copies this instead of redoing the key setup
+_HMAC_TEMPLATE = hmac.new(SECRET_KEY, None, hashlib.sha256)
 
 def generate_license(hwid, days=None):
     data = {
@@ -21,7 +23,9 @@ def generate_license(hwid, days=None):
     json_str = json.dumps(data)
     b64_payload = base64.b64encode(json_str.encode()).decode()
     
-    signature = hmac.new(SECRET_KEY, b64_payload.encode(), hashlib.sha256).hexdigest()
+    h = _HMAC_TEMPLATE.copy()
+    h.update(b64_payload.encode())
+    signature = h.hexdigest()
     
     return f"{b64_payload}.{signature}"
 
@@ -1,29 +1,56 @@
 import sys
 import os
 import time
-from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget, QSizeGrip, QSplashScreen
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QFont, QColor
-from app.ui.downloader_tab import DownloaderTab
-from app.ui.settings_tab import SettingsTab
-from app.ui.widgets.title_bar import TitleBar
-from app.config.settings_manager import save_settings
+import functools
+from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget, QVBoxLayout, QGridLayout, QWidget, QSizeGrip, QSplashScreen
+from PySide6.QtCore import Qt, QSize, QEventLoop, QRectF
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QPainterPath, QRegion, QFont, QColor, QImageReader
 from app.helpers import resource_path, get_app_path
 
+SPLASH_MIN_SECONDS = 0.4
+
+_ICON_CACHE = {}
+
+def get_icon(relative_path):
+    """Returns a shared QIcon for a bundled image, so each file is loaded only once."""
+    icon = _ICON_CACHE.get(relative_path)
+    if icon is None:
+        path = resource_path(relative_path)
+        icon = QIcon(path) if os.path.exists(path) else QIcon()
+        _ICON_CACHE[relative_path] = icon
+    return icon
+
+LOGO_PATH = os.path.join("app", "resources", "images", "logo.png")
+
+WINDOW_CORNER_RADIUS = 8 # Matches MainCentralWidget's border-radius in styles.qss
+
+@functools.lru_cache(maxsize=8)
+def rounded_window_region(width, height):
+    """Returns the window mask for a given size, with the corners rounded off."""
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0, 0, width, height), WINDOW_CORNER_RADIUS, WINDOW_CORNER_RADIUS)
+    return QRegion(path.toFillPolygon().toPolygon())
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Imported here rather than at module top so the splash is on screen
+        # before the widget tree (and the scraping stack behind it) loads
+        from app.ui.downloader_tab import DownloaderTab
+        from app.ui.widgets.title_bar import TitleBar
+
         self.setWindowTitle("Social download manager")
         self.resize(1280, 720)
         
         # Set Window Icon
-        logo_path = resource_path(os.path.join("app", "resources", "images", "logo.png"))
-        if os.path.exists(logo_path):
-            self.setWindowIcon(QIcon(logo_path))
+        logo_icon = get_icon(LOGO_PATH)
+        if not logo_icon.isNull():
+            self.setWindowIcon(logo_icon)
         
         # Frameless window for custom title bar
         self.setWindowFlags(Qt.FramelessWindowHint)
-        self.setAttribute(Qt.WA_TranslucentBackground) # Optional, for rounded corners if needed
+        # Rounded corners come from a mask (see resizeEvent), which keeps the
+        # window opaque instead of alpha-blending the whole surface on every repaint
 
         # Central Widget Wrapper
         central_widget = QWidget()
@@ -42,34 +69,63 @@ class MainWindow(QMainWindow):
         # Create a central tab widget
         self.tabs = QTabWidget()
         self.tabs.setIconSize(QSize(24, 24))
-        main_layout.addWidget(self.tabs)
+
+        # The tabs and the size grip share one grid cell, so the layout keeps
+        # the grip anchored bottom right over the tabs on every resize
+        content_layout = QGridLayout()
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.addWidget(self.tabs, 0, 0)
+        main_layout.addLayout(content_layout)
 
         # Add the downloader tab
         self.downloader_tab = DownloaderTab()
-        self.tabs.addTab(self.downloader_tab, QIcon(resource_path("app/resources/images/icons/download.png")), "Downloader")
+        self.tabs.addTab(self.downloader_tab, get_icon("app/resources/images/icons/download.png"), "Downloader")
 
-        # Add the settings tab
-        self.settings_tab = SettingsTab()
-        self.tabs.addTab(self.settings_tab, QIcon(resource_path("app/resources/images/icons/settings.png")), "Settings")
+        # Add the settings tab. Only a placeholder page exists at startup; the
+        # SettingsTab itself is built when first shown or first read.
+        self.settings_tab = None
+        self.settings_page = QWidget()
+        self._settings_page_layout = QVBoxLayout(self.settings_page)
+        self._settings_page_layout.setContentsMargins(0, 0, 0, 0)
+        self.tabs.addTab(self.settings_page, get_icon("app/resources/images/icons/settings.png"), "Settings")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Connect settings to downloader
-        self.downloader_tab.set_settings_tab(self.settings_tab)
+        self.downloader_tab.set_settings_tab_factory(self.ensure_settings_tab)
 
         # Size Grip (Bottom Right Resizing)
-        self.size_grip = QSizeGrip(self)
+        self.size_grip = QSizeGrip(central_widget)
         self.size_grip.setStyleSheet("width: 20px; height: 20px; margin: 5px; background-color: transparent;")
+        content_layout.addWidget(self.size_grip, 0, 0, Qt.AlignRight | Qt.AlignBottom)
+
+    def ensure_settings_tab(self):
+        """Returns the settings tab, building it into its page on first use."""
+        if self.settings_tab is None:
+            from app.ui.settings_tab import SettingsTab
+            self.settings_tab = SettingsTab()
+            self._settings_page_layout.addWidget(self.settings_tab)
+        return self.settings_tab
+
+    def _on_tab_changed(self, index):
+        if self.tabs.widget(index) is self.settings_page:
+            self.ensure_settings_tab()
 
     def resizeEvent(self, event):
-        # Position the size grip at the bottom right
-        rect = self.rect()
-        self.size_grip.move(rect.right() - self.size_grip.width(), rect.bottom() - self.size_grip.height())
+        self.setMask(rounded_window_region(self.width(), self.height()))
         super().resizeEvent(event)
 
     def closeEvent(self, event):
         """Handle application closure to save settings."""
+        from app.config.settings_manager import load_settings, save_settings
         try:
-            # Gather settings from tabs
-            settings_tab_data = self.settings_tab.get_settings()
+            # Gather settings from tabs; a settings tab that was never built
+            # was never edited, so what is on disk is still current
+            if self.settings_tab is not None:
+                # Let a background save from the settings tab finish first
+                self.settings_tab.wait_for_pending_saves()
+                settings_tab_data = self.settings_tab.get_settings()
+            else:
+                settings_tab_data = load_settings()
             downloader_tab_data = self.downloader_tab.get_ui_state()
             
             # Merge settings
@@ -84,58 +140,26 @@ class MainWindow(QMainWindow):
         event.accept()
 
 
-def main():
-    """
-    The main function to run the application.
-    """
-    # Ensure local directory is in PATH for finding ffmpeg.exe etc.
-    app_path = get_app_path()
-    os.environ["PATH"] += os.pathsep + app_path
-    
-    # Ensure Playwright can find browsers (Critical for Frozen/EXE)
-    # 1. Check for bundled browsers next to executable or in _internal
-    bundled_browsers = os.path.join(app_path, 'playwright-browsers')
-    internal_browsers = os.path.join(app_path, '_internal', 'playwright-browsers')
-    
-    if os.path.exists(bundled_browsers):
-        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = bundled_browsers
-        # print(f"Using bundled browsers at: {bundled_browsers}")
-    elif os.path.exists(internal_browsers):
-         os.environ["PLAYWRIGHT_BROWSERS_PATH"] = internal_browsers
-         # print(f"Using internal browsers at: {internal_browsers}")
-    elif "PLAYWRIGHT_BROWSERS_PATH" not in os.environ:
-        # 2. Fallback: Default location on Windows (Development / User Install)
-        default_pw_path = os.path.join(os.environ.get('LOCALAPPDATA', ''), 'ms-playwright')
-        if os.path.exists(default_pw_path):
-            os.environ["PLAYWRIGHT_BROWSERS_PATH"] = default_pw_path
-            # print(f"Set PLAYWRIGHT_BROWSERS_PATH to: {default_pw_path}")
-    
-    app = QApplication(sys.argv)
-    
-    # --- Set App Icon (Taskbar & Window) ---
-    logo_path = resource_path(os.path.join("app", "resources", "images", "logo.png"))
-    if os.path.exists(logo_path):
-        app_icon = QIcon(logo_path)
-        app.setWindowIcon(app_icon)
-        
-        # Windows Taskbar Icon Fix (App User Model ID)
-        if sys.platform == 'win32':
-            import ctypes
-            myappid = 'com.video.downloader.sdm.v1' # Arbitrary string
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-    
-    # --- Splash Screen Setup ---
-    # Create a pixmap for the splash screen
+# Bump whenever render_splash_pixmap draws something different, so cached
+# splash images from older releases are not shown again
+SPLASH_RENDER_VERSION = 1
+
+
+def render_splash_pixmap(logo_path):
+    """Paints the splash screen: logo, "SDM" and "Loading..." on the theme background."""
     splash_pix = QPixmap(400, 300)
     splash_pix.fill(QColor("#101014")) # Background color matching the theme
 
     painter = QPainter(splash_pix)
     
     # Load and draw logo
-    logo_path = resource_path(os.path.join("app", "resources", "images", "logo.png"))
-    if os.path.exists(logo_path):
-        logo = QPixmap(logo_path)
-        logo = logo.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    reader = QImageReader(logo_path)
+    if reader.canRead():
+        # Decode straight at the target size instead of scaling a full-size pixmap
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(100, 100, Qt.KeepAspectRatio))
+        logo = QPixmap.fromImage(reader.read())
         
         # Center the logo
         logo_x = (splash_pix.width() - logo.width()) // 2
@@ -170,24 +194,123 @@ def main():
     painter.drawText(loading_x, loading_y, loading_text)
 
     painter.end()
+    return splash_pix
+
+
+@functools.lru_cache(maxsize=None)
+def load_stylesheet(style_file):
+    """
+    Returns the stylesheet text, read once per process. One binary read with an
+    explicit decode: no newline translation pass and no dependence on the
+    locale's default encoding.
+    """
+    with open(style_file, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def load_splash_pixmap():
+    """
+    Returns the splash pixmap. The painted result is cached as a PNG next to
+    the app (keyed on SPLASH_RENDER_VERSION and the logo's mtime), so later
+    starts decode one image instead of scaling the logo and laying out text
+    again. Writing a new cache file removes the stale ones.
+    """
+    logo_path = resource_path(LOGO_PATH)
+    try:
+        stamp = int(os.stat(logo_path).st_mtime)
+    except OSError:
+        stamp = 0
+    cache_dir = os.path.join(get_app_path(), '.cache')
+    cache_name = f'splash_v{SPLASH_RENDER_VERSION}_{stamp}.png'
+    cache_path = os.path.join(cache_dir, cache_name)
+
+    # A missing cache file just loads as a null pixmap; no separate exists() probe
+    cached = QPixmap(cache_path)
+    if not cached.isNull():
+        return cached
+
+    splash_pix = render_splash_pixmap(logo_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        splash_pix.save(cache_path, "PNG")
+        for entry in os.scandir(cache_dir):
+            if entry.name.startswith('splash_') and entry.name.endswith('.png') and entry.name != cache_name:
+                os.remove(entry.path)
+    except OSError:
+        pass # Caching is best-effort; the painted pixmap is still usable
+    return splash_pix
+
+
+def configure_environment(app_path):
+    """
+    Puts the app folder on PATH (for ffmpeg.exe etc.) and points Playwright at
+    its browsers, which is critical for frozen/EXE builds.
+    """
+    os.environ["PATH"] = os.environ.get("PATH", "") + os.pathsep + app_path
+
+    # 1. Browsers bundled next to the executable or in _internal always win
+    bundled = (
+        os.path.join(app_path, 'playwright-browsers'),
+        os.path.join(app_path, '_internal', 'playwright-browsers'),
+    )
+    browsers_path = next((path for path in bundled if os.path.isdir(path)), None)
+    if browsers_path:
+        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
+    elif "PLAYWRIGHT_BROWSERS_PATH" not in os.environ:
+        # 2. Fallback: Default location on Windows (Development / User Install);
+        # never replaces a path the user set themselves
+        default_pw_path = os.path.join(os.environ.get('LOCALAPPDATA', ''), 'ms-playwright')
+        if os.path.isdir(default_pw_path):
+            os.environ["PLAYWRIGHT_BROWSERS_PATH"] = default_pw_path
+
+
+def main():
+    """
+    The main function to run the application.
+    """
+    configure_environment(get_app_path())
+    
+    app = QApplication(sys.argv)
+    
+    # --- Set App Icon (Taskbar & Window) ---
+    app_icon = get_icon(LOGO_PATH)
+    if not app_icon.isNull():
+        app.setWindowIcon(app_icon)
+        
+        # Windows Taskbar Icon Fix (App User Model ID)
+        if sys.platform == 'win32':
+            import ctypes
+            myappid = 'com.video.downloader.sdm.v1' # Arbitrary string
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+    
+    # --- Splash Screen Setup ---
+    splash_pix = load_splash_pixmap()
 
     # Show Splash
     splash = QSplashScreen(splash_pix, Qt.WindowStaysOnTopHint)
+    splash_shown_at = time.monotonic()
     splash.show()
-    app.processEvents()
+    # Single sync point so the splash paints once; input waits until the window exists
+    app.processEvents(QEventLoop.ExcludeUserInputEvents)
 
     # Load and apply stylesheet
     style_file = resource_path(os.path.join("app", "resources", "styles.qss"))
-    if os.path.exists(style_file):
-        with open(style_file, "r") as f:
-            app.setStyleSheet(f.read())
-    else:
+    try:
+        app.setStyleSheet(load_stylesheet(style_file))
+    except FileNotFoundError:
         print(f"Warning: Stylesheet not found at {style_file}")
 
-    # Simulate initialization delay (for effect)
-    time.sleep(2)
-
     window = MainWindow()
+    # Start the update check now so its network round trip overlaps the rest
+    # of startup; the result only restyles a button whenever it arrives
+    window.downloader_tab.run_silent_update_check()
+
+    # Keep the splash up for a brief minimum so it doesn't just flash;
+    # startup work already spent counts toward it
+    remaining = SPLASH_MIN_SECONDS - (time.monotonic() - splash_shown_at)
+    if remaining > 0:
+        time.sleep(remaining)
+
     window.show()
     
     # Finish splash screen
@@ -196,4 +319,7 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Lets frozen builds start the cookie verification process pool
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,12 @@
+import pytest
+
+@pytest.fixture
+def downloader_tab(qtbot):
+    """
+    A DownloaderTab on the session-wide QApplication that pytest-qt provides.
+    """
+    from app.ui.downloader_tab import DownloaderTab
+
+    widget = DownloaderTab()
+    qtbot.addWidget(widget)
+    return widget
@@ -1,54 +1,42 @@
-import unittest
+import pytest
 from unittest.mock import MagicMock
-from PySide6.QtWidgets import QApplication, QTableWidget
-import sys
-from app.ui.downloader_tab import DownloaderTab
 
-class TestUiIssue(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        if not QApplication.instance():
-            cls.app = QApplication(sys.argv)
-        else:
-            cls.app = QApplication.instance()
+pytestmark = pytest.mark.qt
 
-    def setUp(self):
-        self.tab = DownloaderTab()
-        # Mock dependencies
-        self.tab.settings_tab = MagicMock()
-        self.tab.downloader = MagicMock()
-        self.tab.platform_handler_factory = MagicMock()
-        
-        # Mock settings to allow multiple videos
-        self.settings = {
-            'video': {'enabled': True, 'top': False, 'count': 50, 'all': True, 'resolution': '1080p'},
-            'photo': {'enabled': True, 'top': False, 'count': 50, 'all': True, 'quality': 'High'}
-        }
-        self.tab.settings_tab.get_settings.return_value = self.settings
+def test_multiple_items_added_to_ui(downloader_tab, qtbot):
+    tab = downloader_tab
+    # Mock dependencies
+    tab.settings_tab = MagicMock()
+    tab.downloader = MagicMock()
+    tab.platform_handler_factory = MagicMock()
 
-    def test_multiple_items_added_to_ui(self):
-        handler = MagicMock()
-        # Return 5 video items
-        mock_metadata = [
-            {'url': f'http://test.com/video{i}.mp4', 'title': f'Video {i}', 'type': 'scraped_link'}
-            for i in range(5)
-        ]
-        handler.get_playlist_metadata.return_value = mock_metadata
-        self.tab.platform_handler_factory.get_handler.return_value = handler
-        self.tab.downloader.add_to_queue.side_effect = lambda url, h, s: f"id_{url}"
+    # Mock settings to allow multiple videos
+    settings = {
+        'video': {'enabled': True, 'top': False, 'count': 50, 'all': True, 'resolution': '1080p'},
+        'photo': {'enabled': True, 'top': False, 'count': 50, 'all': True, 'quality': 'High'}
+    }
+    tab.settings_tab.get_settings.return_value = settings
 
-        # Run scraping
-        print("\n--- Starting Scraping ---")
-        self.tab.process_scraping('http://test.com/playlist')
-        print("--- Finished Scraping ---")
+    handler = MagicMock()
+    # Return 5 video items
+    mock_metadata = [
+        {'url': f'http://test.com/video{i}.mp4', 'title': f'Video {i}', 'type': 'scraped_link'}
+        for i in range(5)
+    ]
+    def fake_playlist_metadata(url, max_entries, settings, callback):
+        for metadata in mock_metadata:
+            callback(metadata)
+        return mock_metadata
+    handler.get_playlist_metadata.side_effect = fake_playlist_metadata
+    tab.platform_handler_factory.get_handler.return_value = handler
+    tab.downloader.add_to_queue.side_effect = lambda url, h, s: f"id_{url}"
 
-        # Check Queue calls
-        self.assertEqual(self.tab.downloader.add_to_queue.call_count, 5)
-        
-        # Check UI Table Count
-        row_count = self.tab.activity_table.rowCount()
-        print(f"Final UI Row Count: {row_count}")
-        self.assertEqual(row_count, 5)
+    # Run scraping; the worker thread reports back through queued signals
+    tab.process_scraping('http://test.com/playlist')
+    qtbot.waitUntil(lambda: not tab.active_scraping_workers, timeout=5000)
 
-if __name__ == '__main__':
-    unittest.main()
+    # Check Queue calls
+    assert tab.downloader.add_to_queue.call_count == 5
+
+    # Check UI Table Count
+    assert tab.activity_table.rowCount() == 5
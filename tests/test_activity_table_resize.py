@@ -1,16 +1,12 @@
 import pytest
 from PySide6.QtWidgets import QHeaderView
-from app.ui.downloader_tab import DownloaderTab
 
 @pytest.mark.qt
-def test_activity_table_resize_mode(qtbot):
+def test_activity_table_resize_mode(downloader_tab):
     """
     Verify that the activity table columns are set to Interactive (resizable).
     """
-    widget = DownloaderTab()
-    qtbot.addWidget(widget)
-    
-    header = widget.activity_table.horizontalHeader()
+    header = downloader_tab.activity_table.horizontalHeader()
     
     # Check column 0 is ResizeToContents
     assert header.sectionResizeMode(0) == QHeaderView.ResizeToContents
@@ -0,0 +1,39 @@
+"""
+Tests for the credentials manager.
+"""
+import json
+from app.config.credentials import CredentialsManager
+
+def test_set_all_writes_every_platform_once(tmp_path):
+    config_path = str(tmp_path / "credentials.json")
+    manager = CredentialsManager(config_path=config_path)
+
+    manager.set_all({
+        'facebook': {'cookie_file': 'fb.txt', 'browser': 'None'},
+        'youtube': {'cookie_file': '', 'browser': 'chrome'},
+    })
+
+    with open(config_path) as f:
+        saved = json.load(f)
+    assert saved['facebook']['cookie_file'] == 'fb.txt'
+    assert saved['youtube']['browser'] == 'chrome'
+    assert not (tmp_path / "credentials.json.tmp").exists()
+
+    # A fresh manager sees the same data through get_all
+    reloaded = CredentialsManager(config_path=config_path).get_all()
+    assert reloaded == saved
+
+def test_unchanged_credentials_skip_the_write(tmp_path, monkeypatch):
+    config_path = str(tmp_path / "credentials.json")
+    manager = CredentialsManager(config_path=config_path)
+    manager.set_all({'facebook': {'cookie_file': 'fb.txt'}})
+
+    writes = []
+    monkeypatch.setattr(manager, "save_credentials", lambda: writes.append(1))
+
+    manager.set_all({'facebook': {'cookie_file': 'fb.txt'}})
+    manager.set_credential('facebook', 'cookie_file', 'fb.txt')
+    assert writes == []
+
+    manager.set_credential('facebook', 'browser', 'chrome')
+    assert writes == [1]
@@ -0,0 +1,35 @@
+"""
+Tests for the helper utilities.
+"""
+import io
+import json
+import pytest
+from app import helpers
+from app.helpers import parse_version
+
+def test_parse_version():
+    assert parse_version("26.0.1") == (26, 0, 1)
+    assert parse_version("26.0.10") > parse_version("26.0.9")
+    assert parse_version("26.1-beta") is None
+    assert parse_version(None) is None
+
+@pytest.mark.parametrize("remote, expected", [
+    ("26.0.2", True),
+    ("26.0.1", False),
+    ("26.0.0", False), # Older remote is not an update
+    ("27.0.0-rc1", True), # Unparseable falls back to "different means update"
+])
+def test_check_for_updates_compares_numerically(monkeypatch, remote, expected):
+    import app.config.version as version
+
+    monkeypatch.setattr(version, "VERSION", "26.0.1")
+    helpers._current_version_info.cache_clear()
+    monkeypatch.setattr(helpers.urllib.request, "urlopen",
+                        lambda req, timeout: io.BytesIO(json.dumps({"version": remote}).encode()))
+    try:
+        available, info = helpers.check_for_updates()
+    finally:
+        helpers._current_version_info.cache_clear()
+
+    assert available is expected
+    assert (info == {"version": remote}) if expected else info is None
@@ -2,6 +2,7 @@
 """
 Tests for the platform handlers.
 """
+import json
 import pytest
 from app.platform_handler import PlatformHandlerFactory
 
@@ -37,6 +38,21 @@ def test_no_handler():
     handler = factory.get_handler(unsupported_url)
     assert handler is None
 
+def test_handler_lookup_is_cached(monkeypatch):
+    """
+    Tests that repeated lookups for the same URL only probe the handlers once.
+    """
+    factory = PlatformHandlerFactory()
+    calls = []
+    youtube = factory.handlers[0]
+    original = youtube.can_handle
+    monkeypatch.setattr(youtube, "can_handle", lambda url: calls.append(url) or original(url))
+
+    url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    assert factory.get_handler(url) is youtube
+    assert factory.get_handler(url) is youtube
+    assert calls == [url]
+
 def test_handler_metadata_stub():
     """
     Tests the stubbed get_metadata method for a handler.
@@ -50,3 +66,278 @@ def test_handler_metadata_stub():
     assert 'url' in metadata[0]
     assert 'title' in metadata[0]
 
+def test_stream_to_file_reports_each_percent_once(tmp_path):
+    """
+    Tests that direct downloads copy the whole file and only report
+    progress when the percentage changes.
+    """
+    from app.platform_handler import _stream_to_file
+
+    source = tmp_path / "source.bin"
+    payload = bytes(range(256)) * 1000
+    source.write_bytes(payload)
+    target = tmp_path / "target.bin"
+
+    reported = []
+    _stream_to_file(source.as_uri(), str(target), reported.append, chunk_size=1000)
+
+    assert target.read_bytes() == payload
+    assert reported == sorted(set(reported))
+    assert reported[-1] == 100
+
+def test_supplied_browser_is_used_and_left_open():
+    """
+    Tests that a caller-supplied browser is yielded as-is and not closed.
+    """
+    from app.platform_handler import _chromium_browser
+
+    class FakeBrowser:
+        closed = False
+        def close(self):
+            self.closed = True
+
+    browser = FakeBrowser()
+    with _chromium_browser(browser=browser) as yielded:
+        assert yielded is browser
+    assert not browser.closed
+
+def test_disconnected_reusable_browser_stops_its_driver(monkeypatch):
+    """
+    Tests that a cached browser which is no longer connected has its
+    Playwright driver stopped before a replacement is launched.
+    """
+    import app.platform_handler as platform_handler
+
+    class FakeBrowser:
+        def __init__(self, connected):
+            self.connected = connected
+            self.closed = False
+        def is_connected(self):
+            return self.connected
+        def close(self):
+            self.closed = True
+
+    class FakePlaywright:
+        def __init__(self):
+            self.stopped = False
+        def stop(self):
+            self.stopped = True
+
+    stale_p, stale_browser = FakePlaywright(), FakeBrowser(connected=False)
+    fresh_p, fresh_browser = FakePlaywright(), FakeBrowser(connected=True)
+    events = []
+
+    class FakeSyncPlaywright:
+        def start(self):
+            events.append(("start", stale_p.stopped))
+            return fresh_p
+
+    key = platform_handler.threading.get_ident()
+    monkeypatch.setitem(platform_handler._reusable_browsers, key, (stale_p, stale_browser))
+    monkeypatch.setattr(platform_handler, "sync_playwright", FakeSyncPlaywright, raising=False)
+    monkeypatch.setattr(platform_handler, "_launch_chromium", lambda p: fresh_browser)
+
+    assert platform_handler._get_reusable_browser() is fresh_browser
+    assert stale_browser.closed and stale_p.stopped
+    assert events == [("start", True)]
+    assert platform_handler._reusable_browsers[key] == (fresh_p, fresh_browser)
+
+def test_pws_data_read_from_response_body():
+    """
+    Tests that Pinterest page state is taken from the HTML response without
+    touching the DOM, and that the DOM is used when the HTML lacks it.
+    """
+    from app.platform_handler import _read_pws_data
+
+    class FakeResponse:
+        def __init__(self, body):
+            self._body = body
+        def body(self):
+            return self._body
+
+    class FakePage:
+        def evaluate(self, script):
+            return '{"from": "dom"}'
+
+    html = b'<html><script id="__PWS_DATA__" type="application/json">{"from": "html"}</script></html>'
+    assert json.loads(_read_pws_data(FakePage(), FakeResponse(html))) == {"from": "html"}
+    assert json.loads(_read_pws_data(FakePage(), FakeResponse(b"<html></html>"))) == {"from": "dom"}
+    assert json.loads(_read_pws_data(FakePage(), None)) == {"from": "dom"}
+
+def test_pinterest_json_walk_finds_first_match_in_document_order():
+    """
+    Tests that the Pinterest JSON lookups return the first usable URL,
+    preferring higher-quality variants and skipping empty ones.
+    """
+    from app.platform_handler import _find_pinterest_video_url, _find_pinterest_image_url
+
+    data = {
+        "props": [
+            {"video_list": {"V_720P": {"url": ""}}},
+            {"pin": {"video_list": {"V_EXP7": {"url": "exp7.mp4"}, "V_720P": {"url": "720.mp4"}}}},
+            {"video_list": {"V_HLSV3_MOBILE": {"url": "later.m3u8"}}},
+        ],
+        "images": {"large": {"url": "large.jpg"}, "orig": {"url": "orig.jpg"}},
+    }
+    assert _find_pinterest_video_url(data) == "720.mp4"
+    assert _find_pinterest_image_url(data) == "orig.jpg"
+    assert _find_pinterest_video_url({"a": [1, "x", None]}) is None
+
+def test_parse_cookie_file(tmp_path):
+    """
+    Tests that Netscape cookie files parse into Playwright cookies, skipping
+    comments, blank lines and short rows.
+    """
+    from app.platform_handler import parse_cookie_file
+
+    cookie_file = tmp_path / "cookies.txt"
+    cookie_file.write_text(
+        "# Netscape HTTP Cookie File\n"
+        "\n"
+        ".example.com\tTRUE\t/\tTRUE\t1700000000\tsid\tabc\n"
+        "example.com\tFALSE\t/app\tFALSE\tsession\tlang\ten\r\n"
+        "broken\tline\n",
+        encoding="utf-8",
+    )
+
+    cookies = parse_cookie_file(str(cookie_file))
+
+    assert [c['name'] for c in cookies] == ['sid', 'lang']
+    assert cookies[0] == {
+        'name': 'sid', 'value': 'abc', 'domain': '.example.com', 'path': '/',
+        'expires': 1700000000, 'httpOnly': False, 'secure': True, 'sameSite': 'Lax',
+    }
+    assert cookies[1]['expires'] == 0 and cookies[1]['secure'] is False
+    assert parse_cookie_file(str(tmp_path / "missing.txt")) == []
+
+    # Unchanged files come from the cache; rewritten ones are parsed again
+    assert parse_cookie_file(str(cookie_file)) == cookies
+    cookie_file.write_text(".example.com\tTRUE\t/\tTRUE\t0\tother\tvalue\n", encoding="utf-8")
+    assert [c['name'] for c in parse_cookie_file(str(cookie_file))] == ['other']
+
+def test_pinterest_fallback_lookups_run_concurrently(monkeypatch, tmp_path):
+    """
+    Tests that a failed yt-dlp attempt falls through to the fallbacks and
+    that the video and image lookups run side by side.
+    """
+    import threading
+    import app.platform_handler as ph
+
+    both_started = threading.Barrier(2, timeout=5)
+    image_cancelled = []
+    def lookup(result):
+        def run(url, cancelled=None):
+            both_started.wait() # Raises BrokenBarrierError if run one after the other
+            if cancelled is not None:
+                image_cancelled.append(cancelled)
+            return result
+        return run
+
+    attempts = []
+    def fake_ytdlp(url, output_path, progress_callback, settings={}):
+        attempts.append(url)
+        return (url == "https://v.pinimg.com/video.mp4", "Completed")
+
+    monkeypatch.setattr(ph, "download_with_ytdlp", fake_ytdlp)
+    monkeypatch.setattr(ph, "_fetch_pws_data", lambda url: None)
+    monkeypatch.setattr(ph, "_pinterest_video_url_with_playwright", lookup("https://v.pinimg.com/video.mp4"))
+    monkeypatch.setattr(ph, "_pinterest_image_url_with_playwright", lookup("https://i.pinimg.com/image.jpg"))
+
+    handler = ph.PinterestHandler()
+    monkeypatch.setattr(handler, "get_download_path", lambda *args, **kwargs: str(tmp_path))
+    result = handler.download({'url': "https://www.pinterest.com/pin/123/", 'settings': {}}, lambda p: None)
+
+    assert result == (True, "Completed")
+    assert attempts == ["https://www.pinterest.com/pin/123/", "https://v.pinimg.com/video.mp4"]
+    # Finding the video tells the image lookup to stop
+    assert image_cancelled[0].is_set()
+
+@pytest.mark.parametrize("page_state, browser_video, expected_ytdlp, expected_direct", [
+    # A video in the page state: no browser at all
+    (b'{"pin": {"videos": {"video_list": {"V_720P": {"url": "https://v.pinimg.com/720.mp4"}}}}}',
+     "unused", "https://v.pinimg.com/720.mp4", None),
+    # Only an image in the page state: the browser still looks for a video...
+    (b'{"pin": {"images": {"orig": {"url": "https://i.pinimg.com/orig.jpg"}}}}',
+     "https://v.pinimg.com/found.m3u8", "https://v.pinimg.com/found.m3u8", None),
+    # ...and the page-state image is used only when it finds none
+    (b'{"pin": {"images": {"orig": {"url": "https://i.pinimg.com/orig.jpg"}}}}',
+     None, None, "https://i.pinimg.com/orig.jpg"),
+])
+def test_pinterest_fallback_reads_page_state_once(monkeypatch, tmp_path, page_state, browser_video, expected_ytdlp, expected_direct):
+    """
+    Tests that the fallback fetches the page state once, only skips the
+    browser video lookup when the page state has a video, and never starts
+    a browser image lookup when the page state already has an image.
+    """
+    import app.platform_handler as ph
+
+    fetches = []
+    def fake_fetch(url):
+        fetches.append(url)
+        return page_state
+
+    video_lookups = []
+    def fake_video_lookup(url):
+        assert browser_video != "unused", "browser video lookup started"
+        video_lookups.append(url)
+        return browser_video
+
+    def no_image_browser(*args):
+        raise AssertionError("browser image lookup started")
+
+    ytdlp_urls = []
+    def fake_ytdlp(url, *args, **kwargs):
+        ytdlp_urls.append(url)
+        return (url != "https://www.pinterest.com/pin/123/", "Completed")
+
+    downloads = []
+    monkeypatch.setattr(ph, "download_with_ytdlp", fake_ytdlp)
+    monkeypatch.setattr(ph, "download_direct", lambda url, *args: downloads.append(url) or (True, "Completed"))
+    monkeypatch.setattr(ph, "_fetch_pws_data", fake_fetch)
+    monkeypatch.setattr(ph, "_pinterest_video_url_with_playwright", fake_video_lookup)
+    monkeypatch.setattr(ph, "_pinterest_image_url_with_playwright", no_image_browser)
+
+    handler = ph.PinterestHandler()
+    monkeypatch.setattr(handler, "get_download_path", lambda *args, **kwargs: str(tmp_path))
+    result = handler.download({'url': "https://www.pinterest.com/pin/123/", 'settings': {}}, lambda p: None)
+
+    assert result == (True, "Completed")
+    assert fetches == ["https://www.pinterest.com/pin/123/"]
+    assert ytdlp_urls[1:] == ([expected_ytdlp] if expected_ytdlp else [])
+    assert downloads == ([expected_direct] if expected_direct else [])
+    assert video_lookups == ([] if browser_video == "unused" else ["https://www.pinterest.com/pin/123/"])
+
+def test_cancelled_pinterest_image_lookup_starts_no_browser(monkeypatch):
+    """
+    Tests that the browser image lookup returns at once when already cancelled.
+    """
+    import threading
+    import app.platform_handler as ph
+
+    def no_browser():
+        raise AssertionError("browser started")
+
+    monkeypatch.setattr(ph, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(ph, "sync_playwright", no_browser, raising=False)
+    cancelled = threading.Event()
+    cancelled.set()
+    assert ph._pinterest_image_url_with_playwright("https://www.pinterest.com/pin/123/", cancelled) is None
+
+def test_pinterest_lookups_use_page_html_without_a_browser(monkeypatch, tmp_path):
+    """
+    Tests that Pinterest URLs are read from the server-rendered page state
+    over plain HTTP, without starting Playwright.
+    """
+    import app.platform_handler as ph
+
+    monkeypatch.setattr(ph, "PLAYWRIGHT_AVAILABLE", False)
+    page = tmp_path / "pin.html"
+    page.write_bytes(
+        b'<html><script id="__PWS_DATA__" type="application/json">'
+        b'{"pin": {"videos": {"video_list": {"V_720P": {"url": "https://v.pinimg.com/720.mp4"}}},'
+        b' "images": {"orig": {"url": "https://i.pinimg.com/orig.jpg"}}}}'
+        b'</script></html>'
+    )
+
+    assert ph.extract_pinterest_direct_url(page.as_uri()) == "https://v.pinimg.com/720.mp4"
+    assert ph.extract_pinterest_image_url(page.as_uri()) == "https://i.pinimg.com/orig.jpg"
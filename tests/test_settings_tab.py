@@ -0,0 +1,106 @@
+import threading
+import pytest
+from app.ui.settings_tab import SettingsTab
+
+@pytest.mark.qt
+def test_settings_round_trip(qtbot):
+    """
+    Verify that set_settings and get_settings agree on every field.
+    """
+    widget = SettingsTab()
+    qtbot.addWidget(widget)
+
+    settings = {
+        'video': {'enabled': True, 'top': True, 'count': 12, 'all': False, 'resolution': "720p"},
+        'photo': {'enabled': False, 'top': False, 'count': 3, 'all': True, 'quality': "Medium"},
+    }
+    widget.set_settings(settings)
+
+    assert widget.get_settings() == settings
+
+    # Unknown combo text leaves the current selection alone
+    widget.set_settings({'video': {'resolution': "8K"}})
+    assert widget.video_res_combo.currentText() == "720p"
+
+@pytest.mark.qt
+def test_save_runs_in_background(qtbot, monkeypatch):
+    """
+    Verify that saving writes the settings snapshot off the UI thread.
+    """
+    from PySide6.QtWidgets import QMessageBox
+    import app.ui.settings_tab as settings_tab
+
+    saved = {}
+    def fake_save(settings):
+        saved['settings'] = settings
+        saved['thread'] = threading.current_thread()
+        return True
+
+    monkeypatch.setattr(settings_tab, "save_settings", fake_save)
+    monkeypatch.setattr(QMessageBox, "information", lambda *args: None)
+
+    widget = SettingsTab()
+    qtbot.addWidget(widget)
+    monkeypatch.setattr(widget.credentials_manager, "set_all", lambda credentials: None)
+
+    widget.save_current_settings()
+    widget.wait_for_pending_saves()
+
+    assert saved['settings'] == widget.get_settings()
+    assert saved['thread'] is not threading.main_thread()
+
+@pytest.mark.qt
+def test_credential_tabs_build_on_first_show(qtbot, monkeypatch):
+    """
+    Verify that only the visible credential tab is built up front and that
+    later tabs pick up their stored credentials when first shown.
+    """
+    from app.config.credentials import CredentialsManager
+
+    stored = {'youtube': {'cookie_file': "/tmp/yt_cookies.txt", 'browser': "firefox"}}
+    monkeypatch.setattr(CredentialsManager, "get_all", lambda self: stored)
+
+    widget = SettingsTab()
+    qtbot.addWidget(widget)
+
+    assert list(widget.cookie_path_inputs) == ['facebook']
+
+    widget.credentials_tabs.setCurrentIndex(3) # YouTube
+    assert widget.cookie_path_inputs['youtube'].text() == "/tmp/yt_cookies.txt"
+    assert widget.browser_combos['youtube'].currentText() == "firefox"
+
+def _hanging_probe_server(conn):
+    """Probe process stand-in that accepts a request and never answers it."""
+    import time
+    conn.recv()
+    time.sleep(60)
+
+def test_cancel_kills_a_running_probe(monkeypatch):
+    """
+    Verify that cancelling a probe that is already running kills the probe
+    process instead of waiting for yt-dlp to finish.
+    """
+    import time
+    import app.ui.settings_tab as settings_tab
+    from app.ui.settings_tab import CookieVerificationWorker, VERIFY_CANCELLED_MSG
+
+    monkeypatch.setattr(settings_tab, "_probe_server", _hanging_probe_server)
+    worker = CookieVerificationWorker()
+    results = []
+    worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+
+    processes = []
+    def cancel_once_running():
+        processes.append(worker._probe_process)
+        worker.cancel()
+    timer = threading.Timer(1.0, cancel_once_running)
+    timer.start()
+
+    started = time.monotonic()
+    worker.verify("", "chrome", "https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    timer.join()
+
+    assert results == [(False, VERIFY_CANCELLED_MSG)]
+    assert time.monotonic() - started < 30
+    assert processes[0] is not None and not processes[0].is_alive()
+    assert worker._probe_process is None
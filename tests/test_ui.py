@@ -3,23 +3,17 @@
 UI tests for the downloader application.
 """
 import pytest
-from PySide6.QtWidgets import QApplication
 
 # Mark all tests in this module as needing the qt_bot fixture
 pytestmark = pytest.mark.qt
 
-def test_app_creation(qtbot):
+def test_app_creation(downloader_tab):
     """
     Test that the main window can be created.
     This is a very basic smoke test.
     """
-    # Import inside the test to avoid issues with QApplication instance
-    from app.ui.downloader_tab import DownloaderTab
-
-    # QApplication is already created by pytest-qt
-    
-    widget = DownloaderTab()
-    qtbot.addWidget(widget)
+    # The fixture builds the tab on the QApplication pytest-qt already created
+    widget = downloader_tab
 
     # Check if the window title is set correctly (if it were a main window)
     # For a QWidget, we can check if it's visible